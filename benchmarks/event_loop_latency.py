@@ -0,0 +1,110 @@
+"""Event-loop latency while polling YouTube trackers, before and after YouTubeClient.
+
+"Before" runs each API request inline in the coroutine, the way the tracker
+code used to call ``.execute()``. "After" goes through ``YouTubeClient.call``,
+which runs it on the client's worker pool. ``_execute`` is stubbed with a
+sleep, so no network or API key is needed:
+
+    python benchmarks/event_loop_latency.py --trackers 200 --latency 0.08
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube_api import YouTubeClient  # noqa: E402
+
+TICK = 0.005  # Seconds between lag probes
+
+
+class LagMonitor:
+    """Measures how late the loop wakes a coroutine that sleeps TICK at a time"""
+
+    def __init__(self):
+        self.lags = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(TICK)
+            self.lags.append(loop.time() - start - TICK)
+
+    def __enter__(self):
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+
+    def summary(self) -> dict:
+        lags = sorted(self.lags) or [0.0]
+        return {
+            'probes': len(self.lags),
+            'p50_ms': statistics.median(lags) * 1000,
+            'p99_ms': lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000,
+            'max_ms': lags[-1] * 1000
+        }
+
+
+def stub_client(latency: float, workers: int) -> YouTubeClient:
+    client = YouTubeClient('benchmark', max_workers=workers)
+
+    def execute(resource, method, params):
+        time.sleep(latency)  # A blocking HTTP round trip
+        return {'items': [{'id': params.get('id')}]}
+
+    client._execute = execute
+    return client
+
+
+async def poll_inline(client: YouTubeClient, trackers: int):
+    for i in range(trackers):
+        client._execute('channels', 'list', {'part': 'statistics', 'id': f'UC{i}'})
+        await asyncio.sleep(0)
+
+
+async def poll_executor(client: YouTubeClient, trackers: int):
+    await asyncio.gather(*(
+        client.call('channels', 'list', part='statistics', id=f'UC{i}') for i in range(trackers)
+    ))
+
+
+async def measure(poll, client: YouTubeClient, trackers: int) -> dict:
+    with LagMonitor() as monitor:
+        await asyncio.sleep(TICK * 4)  # Let the monitor take a few idle probes first
+        started = time.perf_counter()
+        await poll(client, trackers)
+        elapsed = time.perf_counter() - started
+    return {'poll_s': elapsed, **monitor.summary()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--trackers', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.08, help="Simulated seconds per API call")
+    parser.add_argument('--workers', type=int, default=8, help="YouTubeClient pool size")
+    args = parser.parse_args()
+
+    client = stub_client(args.latency, args.workers)
+    try:
+        results = {
+            'before (inline .execute())': asyncio.run(measure(poll_inline, client, args.trackers)),
+            'after (YouTubeClient.call)': asyncio.run(measure(poll_executor, client, args.trackers))
+        }
+    finally:
+        client.shutdown()
+
+    print(f"{args.trackers} trackers, {args.latency * 1000:.0f} ms per call, {args.workers} workers")
+    print(f"{'':28} {'poll':>8} {'lag p50':>10} {'lag p99':>10} {'lag max':>10}")
+    for name, result in results.items():
+        print(f"{name:28} {result['poll_s']:7.2f}s {result['p50_ms']:8.1f}ms "
+              f"{result['p99_ms']:8.1f}ms {result['max_ms']:8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""YouTubeFeedPoller against a local fixture server, no network access needed.
+
+The server serves a small Atom feed for any ``channel_id`` with an ETag and
+answers a matching ``If-None-Match`` with 304. The first round fetches every
+feed; the second round should be all 304s served from the poller's cache:
+
+    python benchmarks/feed_poller.py --channels 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube_feeds import YouTubeFeedPoller  # noqa: E402
+
+ENTRIES_PER_FEED = 15
+FEED_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">
+ <title>{channel_id}</title>
+{entries}</feed>
+"""
+ENTRY_TEMPLATE = """ <entry>
+  <yt:videoId>{video_id}</yt:videoId>
+  <yt:channelId>{channel_id}</yt:channelId>
+  <title>Video {index}</title>
+  <published>2026-10-{day:02d}T12:00:00+00:00</published>
+  <media:group><media:thumbnail url="https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"/></media:group>
+ </entry>
+"""
+
+
+def fixture_feed(channel_id: str) -> bytes:
+    entries = "".join(
+        ENTRY_TEMPLATE.format(video_id=f"{channel_id[-6:]}v{index:02d}", channel_id=channel_id, index=index, day=28 - index)
+        for index in range(ENTRIES_PER_FEED)
+    )
+    return FEED_TEMPLATE.format(channel_id=channel_id, entries=entries).encode()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like YouTube
+    counts = {'200': 0, '304': 0}
+
+    def do_GET(self):
+        channel_id = parse_qs(urlparse(self.path).query).get('channel_id', [''])[0]
+        etag = f'"{channel_id}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.counts['304'] += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = fixture_feed(channel_id)
+        self.counts['200'] += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/atom+xml')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def poll_round(poller: YouTubeFeedPoller, channel_ids: list) -> tuple:
+    started = time.perf_counter()
+    results = await asyncio.gather(*(poller.fetch_uploads(channel_id) for channel_id in channel_ids))
+    return time.perf_counter() - started, results
+
+
+async def run(channel_ids: list, feed_url: str, workers: int) -> list:
+    poller = YouTubeFeedPoller(max_workers=workers, feed_url=feed_url)
+    try:
+        rounds = []
+        for name in ('cold', 'warm'):
+            before = dict(poller.stats)
+            elapsed, results = await poll_round(poller, channel_ids)
+            for channel_id, uploads in zip(channel_ids, results):
+                assert len(uploads) == ENTRIES_PER_FEED, channel_id
+                assert uploads[0]['channel_id'] == channel_id and uploads[0]['published'].endswith('Z')
+            rounds.append((name, elapsed, {key: poller.stats[key] - before[key] for key in before}))
+        return rounds
+    finally:
+        poller.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--channels', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=8, help="Poller pool size")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    feed_url = f"http://127.0.0.1:{server.server_address[1]}/feeds/videos.xml?channel_id={{}}"
+    channel_ids = [f"UC{index:022d}" for index in range(args.channels)]
+    try:
+        rounds = asyncio.run(run(channel_ids, feed_url, args.workers))
+    finally:
+        server.shutdown()
+
+    print(f"{args.channels} channels, {args.workers} workers")
+    for name, elapsed, stats in rounds:
+        print(f"{name:5} {elapsed:6.2f}s {args.channels / elapsed:8.0f} feeds/s  "
+              f"{stats['not_modified']:>6} x 304  {stats['bytes'] / 1024:8.0f} KiB")
+    assert rounds[1][2]['not_modified'] == args.channels, "Warm round should be served entirely by 304s"
+    assert FeedHandler.counts == {'200': args.channels, '304': args.channels}
+
+
+if __name__ == '__main__':
+    main()
@@ -7,16 +7,31 @@ import json
 from datetime import datetime, timedelta
 from typing import Optional
 import asyncio
+import heapq
+from bisect import bisect_right
+import time
 import requests
 from bs4 import BeautifulSoup
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from flask import Flask
+from flask import Flask, request
 from threading import Thread
 import scrim
-from PIL import Image, ImageDraw, ImageFont
+from youtube_api import (
+    YouTubeClient, QuotaPlanner, ChannelResolver, MAX_IDS_PER_REQUEST, DEFAULT_DAILY_QUOTA,
+    CHANNEL_STATS_FIELDS, PLAYLIST_UPLOADS_FIELDS, LIVE_SEARCH_FIELDS, LIVE_DETAILS_FIELDS,
+    QuotaExceeded, call_cost, uploads_playlist_id, parse_playlist_uploads, parse_channel_url,
+    chunked
+)
+from tracker_stats import TimeSeriesStore
+from tracker_analytics import analyze as analyze_channels, DEFAULT_MILESTONES
+from stream_sessions import StreamSession, render_viewer_chart
+from youtube_scraper import YouTubeScraper
+from providers import PlatformProvider
+from notification_outbox import NotificationOutbox
+from youtube_feeds import YouTubeFeedPoller, WebSubSubscriber, parse_feed, verify_signature
 import io
 import sys
+import signal
 
 print("🚀 Bot is starting...")
 
@@ -31,6 +46,42 @@ def home():
 def health_check():
     return 'OK', 200
 
+@app.route('/websub/youtube', methods=['GET', 'POST'])
+def websub_youtube():
+    """WebSub callback: verification handshake (GET) and upload pushes (POST)"""
+    if not websub:
+        return 'WebSub disabled', 404
+
+    if request.method == 'GET':
+        tracked_channels = {
+            tracker['channel_id'] for trackers in social_trackers.values()
+            for tracker in trackers if tracker['platform'] == 'youtube'
+        }
+        if websub.confirm(
+            request.args.get('hub.mode'),
+            request.args.get('hub.topic'),
+            request.args.get('hub.lease_seconds'),
+            tracked_channels
+        ):
+            return request.args.get('hub.challenge', ''), 200
+        return 'Unknown topic', 404
+
+    body = request.get_data()
+    if not verify_signature(websub.secret, body, request.headers.get('X-Hub-Signature')):
+        # Hubs expect a 2xx even for bad signatures; the payload is just ignored
+        print("[WebSub] Ignoring push with invalid signature")
+        return '', 202
+
+    try:
+        uploads = parse_feed([body])
+    except Exception as e:
+        print(f"[WebSub] Could not parse push payload: {e}")
+        return '', 202
+
+    if uploads and bot.is_ready():
+        asyncio.run_coroutine_threadsafe(handle_pushed_uploads(uploads), bot.loop)
+    return '', 204
+
 def run_flask():
     app.run(host='0.0.0.0', port=8080)
 
@@ -42,7 +93,40 @@ if not token:
 
 # YouTube API setup
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-youtube_service = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY) if YOUTUBE_API_KEY else None
+YOUTUBE_MAX_WORKERS = int(os.getenv("YOUTUBE_MAX_WORKERS", "8"))
+YOUTUBE_DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", str(DEFAULT_DAILY_QUOTA)))
+youtube_client = YouTubeClient(
+    YOUTUBE_API_KEY, max_workers=YOUTUBE_MAX_WORKERS, daily_quota=YOUTUBE_DAILY_QUOTA
+) if YOUTUBE_API_KEY else None
+SOCIAL_POLL_INTERVAL = 30  # Seconds between tracker poll cycles
+SOCIAL_SWEEP_CONCURRENCY = int(os.getenv("SOCIAL_SWEEP_CONCURRENCY", "8"))  # Channels polled at once
+SOCIAL_POLL_TIMEOUT = 60  # Seconds before a single channel's poll is abandoned
+quota_planner = QuotaPlanner(youtube_client.quota, SOCIAL_POLL_INTERVAL) if youtube_client else None
+RESOLUTION_FILE = "channel_resolutions.json"
+channel_resolver = ChannelResolver(youtube_client, RESOLUTION_FILE) if youtube_client else None
+# Upload detection backend: "playlist" (1 quota unit per poll) or "feed" (public Atom feed, no quota)
+YOUTUBE_UPLOAD_BACKEND = os.getenv("YOUTUBE_UPLOAD_BACKEND", "playlist").lower()
+youtube_feed_poller = YouTubeFeedPoller(max_workers=YOUTUBE_MAX_WORKERS) if YOUTUBE_UPLOAD_BACKEND == "feed" else None
+UPLOADS_PAGE_SIZE = 10  # Uploads inspected per poll
+# WebSub push notifications, enabled when the public callback URL is configured
+WEBSUB_CALLBACK_URL = os.getenv("WEBSUB_CALLBACK_URL")
+websub = WebSubSubscriber(WEBSUB_CALLBACK_URL, secret=os.getenv("WEBSUB_SECRET")) if WEBSUB_CALLBACK_URL else None
+if websub and not os.getenv("WEBSUB_SECRET"):
+    print("⚠️ WEBSUB_SECRET not set, using a generated secret for this run")
+WEBSUB_FALLBACK_INTERVAL = 900  # Seconds between upload polls for channels with a live push lease
+upload_poll_times = {}
+# Key-less fallback reading public pages, used without an API key or while the quota is exhausted
+YOUTUBE_SCRAPE_FALLBACK = os.getenv("YOUTUBE_SCRAPE_FALLBACK", "on").lower() != "off"
+YOUTUBE_SCRAPE_RATE = float(os.getenv("YOUTUBE_SCRAPE_RATE", "2"))  # Requests per second per host
+youtube_scraper = YouTubeScraper(rate=YOUTUBE_SCRAPE_RATE) if YOUTUBE_SCRAPE_FALLBACK else None
+# Adaptive per-channel polling: a min-heap of (next_due, channel_id) over channel_schedule
+MIN_POLL_INTERVAL = SOCIAL_POLL_INTERVAL  # While live or near a channel's usual activity hours
+MAX_POLL_INTERVAL = 1800
+IDLE_BACKOFF_POLLS = 10  # Idle polls per doubling of the interval
+channel_schedule = {}
+poll_heap = []
+channel_poll_times = {}
+SEEN_VIDEO_WINDOW = 50  # Video IDs remembered per tracker
 
 # Configure intents
 intents = discord.Intents.default()
@@ -64,20 +148,38 @@ EVENT_FILE = "event_schedule.json"
 event_schedule = {}
 SOCIAL_FILE = "social_trackers.json"
 social_trackers = {}
+TRACKER_STATE_FILE = "tracker_state.json"
+tracker_state = {}  # channel_id -> last fetched stats, snapshotted at shutdown
+stats_store = TimeSeriesStore("tracker_stats.json")  # Subscriber/view/video count history per channel
+stream_sessions = {}  # video_id -> StreamSession for streams currently live
+ended_streams = set()  # Sessions kept until their stream-ended cards have been sent
+WARMUP_MAX_AGE = int(os.getenv("WARMUP_MAX_AGE", "3600"))  # Seconds a snapshot skips the startup warm-up
+social_poll_stats = {}  # platform -> stats of its last sweep
+social_providers = {}  # platform -> PlatformProvider, in sweep order
+# Tracker notification delivery: "bot" (channel.send) or "webhook" (one cached webhook per post channel)
+TRACKER_DELIVERY = os.getenv("TRACKER_DELIVERY", "bot").lower()
+TRACKER_WEBHOOK_NAME = "Nexus Social Tracker"
+channel_webhooks = {}  # post channel ID -> discord.Webhook, or None where webhooks can't be used
+# Seconds notifications for one post channel are held to be sent together (0 sends each right away)
+NOTIFY_COALESCE_WINDOW = float(os.getenv("NOTIFY_COALESCE_WINDOW", "2"))
 active_team_collections = {}
 
 # Helper functions
-def format_duration(start_time_str: str) -> str:
-    """Format stream duration from start time"""
+def format_duration(start_time_str: str, end_time_str: str = None) -> str:
+    """Format stream duration from start time, up to now or the given end time"""
     if not start_time_str:
         return "Unknown"
     
     start_time = datetime.fromisoformat(start_time_str.replace('Z',''))
-    duration = datetime.utcnow() - start_time
+    end_time = datetime.fromisoformat(end_time_str.replace('Z','')) if end_time_str else datetime.utcnow()
+    duration = end_time - start_time
     
+    days = duration.days
     hours = duration.seconds // 3600
     minutes = (duration.seconds % 3600) // 60
     
+    if days > 0:
+        return f"{days}d {hours}h {minutes}m"
     if hours > 0:
         return f"{hours}h {minutes}m"
     return f"{minutes}m"
@@ -165,6 +267,45 @@ def save_social_trackers():
     except Exception as e:
         print(f"⚠️ Error saving social trackers: {e}")
 
+def load_tracker_state():
+    global tracker_state
+    try:
+        if os.path.exists(TRACKER_STATE_FILE):
+            with open(TRACKER_STATE_FILE, 'r') as f:
+                snapshot = json.load(f)
+            tracker_state = snapshot.get('channels', {})
+            stream_sessions.update({
+                video_id: StreamSession.from_dict(session) for video_id, session in snapshot.get('streams', {}).items()
+            })
+            if youtube_client:
+                # Seed the metadata cache so the first poll cycle doesn't refetch it
+                saved_at = snapshot.get('saved_at', 0)
+                for channel_id, entry in snapshot.get('metadata', {}).items():
+                    age = datetime.utcnow().timestamp() - saved_at + entry['age']
+                    youtube_client.channel_metadata.set(channel_id, (entry['item'], entry['size']), age=age)
+    except Exception as e:
+        print(f"⚠️ Error loading tracker state: {e}")
+        tracker_state = {}
+
+def save_tracker_state():
+    """Snapshot per-channel stats and cached metadata so the next start can skip warm-up"""
+    snapshot = {
+        'saved_at': datetime.utcnow().timestamp(),
+        'channels': tracker_state,
+        'streams': {video_id: session.to_dict() for video_id, session in stream_sessions.items()},
+        'metadata': {}
+    }
+    if youtube_client:
+        snapshot['metadata'] = {
+            channel_id: {'item': item, 'size': size, 'age': age}
+            for channel_id, (item, size), age in youtube_client.channel_metadata.entries()
+        }
+    try:
+        with open(TRACKER_STATE_FILE, 'w') as f:
+            json.dump(snapshot, f)
+    except Exception as e:
+        print(f"⚠️ Error saving tracker state: {e}")
+
 
 DEFAULT_WELCOME_MESSAGE = """
 
@@ -218,25 +359,6 @@ async def on_ready():
         except Exception as e:
             print(f"❌ Command sync failed: {e}")
     
-    # Prefetch subscriber counts for all tracked YouTube channels on startup
-    for guild_id, trackers in social_trackers.items():
-        for tracker in trackers:
-            if tracker.get('platform') == 'youtube' and youtube_service:
-                try:
-                    request = youtube_service.channels().list(
-                        part='statistics',
-                        id=tracker['channel_id']
-                    )
-                    response = request.execute()
-                    if response.get('items'):
-                        stats = response['items'][0]['statistics']
-                        sub_count_raw = stats.get('subscriberCount')
-                        if sub_count_raw and sub_count_raw.isdigit():
-                            tracker['last_count'] = int(sub_count_raw)
-                except Exception as e:
-                    print(f"[Startup] Error prefetching subs for {tracker.get('account_name', tracker.get('channel_id'))}: {e}")
-    save_social_trackers()
-
     if not hasattr(bot, 'social_task'):
         bot.social_task = bot.loop.create_task(social_update_task())
         print("✅ Started social media tracking task")
@@ -245,6 +367,14 @@ async def on_ready():
         bot.event_task = bot.loop.create_task(event_schedule_notifier())
         print("✅ Started tournament event schedule task")
 
+    if websub and not hasattr(bot, 'websub_task'):
+        bot.websub_task = bot.loop.create_task(websub_lease_task())
+        print("✅ Started WebSub lease renewal task")
+
+    # on_ready fires again on every gateway reconnect, the warm-up only runs once per process
+    if not hasattr(bot, 'warmup_task'):
+        bot.warmup_task = bot.loop.create_task(warm_up_trackers())
+
 @bot.event
 async def on_guild_join(guild):
     """Handle joining new servers"""
@@ -258,24 +388,7 @@ async def on_guild_join(guild):
         await bot.tree.sync(guild=guild)
         print(f"✅ Synced commands for {guild.name}")
         # Prefetch subscriber counts for new guild's trackers
-        guild_id = str(guild.id)
-        trackers = social_trackers.get(guild_id, [])
-        for tracker in trackers:
-            if tracker.get('platform') == 'youtube' and youtube_service:
-                try:
-                    request = youtube_service.channels().list(
-                        part='statistics',
-                        id=tracker['channel_id']
-                    )
-                    response = request.execute()
-                    if response.get('items'):
-                        stats = response['items'][0]['statistics']
-                        sub_count_raw = stats.get('subscriberCount')
-                        if sub_count_raw and sub_count_raw.isdigit():
-                            tracker['last_count'] = int(sub_count_raw)
-                except Exception as e:
-                    print(f"[GuildJoin] Error prefetching subs for {tracker.get('account_name', tracker.get('channel_id'))}: {e}")
-        save_social_trackers()
+        await prefetch_subscriber_counts(social_trackers.get(str(guild.id), []), "GuildJoin")
     except Exception as e:
         print(f"❌ Failed to sync commands for {guild.name}: {e}")
 
@@ -289,8 +402,12 @@ async def on_guild_remove(guild):
         del guild_configs[guild_id]
         save_config()
     if guild_id in social_trackers:
-        del social_trackers[guild_id]
+        removed = social_trackers.pop(guild_id)
         save_social_trackers()
+        # History is only kept for channels some other guild still tracks
+        still_tracked = {tracker['channel_id'] for trackers in social_trackers.values() for tracker in trackers}
+        stats_store.forget({tracker['channel_id'] for tracker in removed} - still_tracked)
+        stats_store.save()
 
 
 
@@ -472,67 +589,359 @@ async def on_message(message: discord.Message):
     await bot.process_commands(message)
 
 # Background tasks
-async def check_subscriber_counts():
-    """Check daily subscriber counts at 8:00 AM IST"""
-    for guild_id, trackers in social_trackers.items():
-        for tracker in trackers:
-            if tracker['platform'] == 'youtube' and youtube_service:
-                try:
-                    request = youtube_service.channels().list(
-                        part='statistics,snippet',
-                        id=tracker['channel_id']
-                    )
-                    response = request.execute()
+def youtube_source():
+    """The API client while it has quota, otherwise the key-less scraper (None if neither is usable)"""
+    if youtube_client and not youtube_client.breaker.is_open:
+        return youtube_client
+    return youtube_scraper
+
+async def prefetch_subscriber_counts(trackers, label: str):
+    """Refresh last_count for the given trackers using batched channel lookups"""
+    youtube_trackers = [tracker for tracker in trackers if tracker.get('platform') == 'youtube']
+    source = youtube_source()
+    if not source or not youtube_trackers:
+        return
 
-                    if not response.get('items'):
-                        continue
+    try:
+        channels = await source.fetch_channels(
+            [tracker['channel_id'] for tracker in youtube_trackers],
+            part='statistics',
+            fields="etag,items(id,statistics)"
+        )
+    except Exception as e:
+        print(f"[{label}] Error prefetching subscriber counts: {e}")
+        return
+
+    for tracker in youtube_trackers:
+        channel_info = channels.get(tracker['channel_id'])
+        if not channel_info:
+            print(f"[{label}] No channel found for {tracker.get('account_name', tracker.get('channel_id'))}")
+            continue
+        sub_count_raw = channel_info['statistics'].get('subscriberCount')
+        if channel_info['statistics'].get('approximate'):
+            continue  # Scraped counts would trip false milestones
+        if sub_count_raw and sub_count_raw.isdigit():
+            tracker['last_count'] = int(sub_count_raw)
+            try:
+                await check_milestone(tracker, tracker['last_count'])
+            except Exception as e:
+                print(f"[{label}] Error checking milestones for {tracker.get('account_name')}: {e}")
+    record_channel_stats(channels)
+    save_social_trackers()
 
-                    channel_info = response['items'][0]
-                    stats = channel_info['statistics']
-                    snippet = channel_info['snippet']
-                    channel_name = snippet['title']
-
-                    sub_count_raw = stats.get('subscriberCount')
-                    if sub_count_raw and sub_count_raw.isdigit():
-                        current_subs = int(sub_count_raw)
-                        last_subs = tracker.get('last_count', 0)
-                        
-                        if isinstance(last_subs, int) and current_subs != last_subs:
-                            tracker['last_count'] = current_subs
-                            channel = bot.get_channel(int(tracker['post_channel']))
-                            if channel:
-                                # Calculate daily growth
-                                sub_change = current_subs - last_subs
-                                growth_emoji = "📈" if sub_change > 0 else "📉"
-                                
-                                embed = discord.Embed(
-                                    title=f"📊 Daily YouTube Stats Update",
-                                    description=(
-                                        f"**Channel:** {channel_name}\n"
-                                        f"**Current Subscribers:** {current_subs:,}\n"
-                                        f"**24h Change:** {growth_emoji} {sub_change:+,}\n"
-                                    ),
-                                    color=discord.Color.blue(),
-                                    url=tracker['url']
-                                )
-                                embed.set_thumbnail(url="https://i.imgur.com/krKzGz0.png")
-                                embed.set_footer(text=f"Daily Update • {datetime.utcnow().strftime('%Y-%m-%d')}")
-                                await channel.send(embed=embed)
+def record_channel_stats(channels: dict):
+    """Snapshot and append to history every channel in a statistics lookup keyed by channel ID"""
+    # Real epoch time: utcnow().timestamp() is off by the host's UTC offset, and the
+    # stats store buckets samples by UTC day
+    fetched_at = time.time()
+    for channel_id, channel_info in channels.items():
+        statistics = channel_info.get('statistics')
+        if not statistics or statistics.get('approximate'):
+            continue  # Scraped, rounded counts would show up as dips and jumps in the exact history
+        stats_store.record(channel_id, statistics, fetched_at)
+        sub_count_raw = statistics.get('subscriberCount')
+        if sub_count_raw and sub_count_raw.isdigit():
+            tracker_state[channel_id] = {'fetched_at': fetched_at, 'subscriber_count': int(sub_count_raw)}
+    stats_store.save()
+
+async def warm_up_trackers():
+    """Prefetch subscriber counts in the background, skipping channels with a fresh snapshot"""
+    await bot.wait_until_ready()
+    now_ts = time.time()  # Same clock as the snapshot's fetched_at
+    stale = []
+    for trackers in social_trackers.values():
+        for tracker in trackers:
+            if tracker.get('platform') != 'youtube':
+                continue
+            state = tracker_state.get(tracker['channel_id'])
+            if state and now_ts - state['fetched_at'] < WARMUP_MAX_AGE:
+                tracker['last_count'] = state['subscriber_count']
+            else:
+                stale.append(tracker)
+
+    started = time.monotonic()
+    await prefetch_subscriber_counts(stale, "Startup")
+    save_tracker_state()
+    print(f"✅ Warm-up refreshed {len(stale)} tracker(s) in {time.monotonic() - started:.1f}s")
+
+async def check_subscriber_counts() -> bool:
+    """Check daily subscriber counts at 8:00 AM IST, returns False if it has to be retried"""
+    source = youtube_source()
+    if not source:
+        # Queued until the quota circuit breaker closes, unless YouTube isn't set up at all
+        return youtube_client is None
+
+    youtube_trackers = [
+        tracker for trackers in social_trackers.values()
+        for tracker in trackers if tracker['platform'] == 'youtube'
+    ]
+    try:
+        channels = await source.fetch_channels(
+            (tracker['channel_id'] for tracker in youtube_trackers),
+            fields=CHANNEL_STATS_FIELDS
+        )
+    except QuotaExceeded:
+        return False
+    except Exception as e:
+        print(f"[YouTube] Error fetching daily stats: {e}")
+        return True
+    record_channel_stats(channels)
 
-                except Exception as e:
-                    print(f"[YouTube] Error checking subs for {tracker.get('account_name')}: {e}")
-                await asyncio.sleep(1)  # Brief pause between API calls
+    # One digest per post channel, with metrics computed for every channel at once.
+    # Scraped counts are only reported as they are, history and milestones stay exact.
+    approximate = {
+        channel_id for channel_id, channel_info in channels.items()
+        if channel_info.get('statistics', {}).get('approximate')
+    }
+    # Milestone projections follow each tracker's own thresholds: one pass per distinct list
+    milestone_groups = {}
+    for tracker in youtube_trackers:
+        if tracker['channel_id'] in channels and tracker['channel_id'] not in approximate:
+            milestone_groups.setdefault(tracker_milestones(tracker), set()).add(tracker['channel_id'])
+    metrics = {
+        milestones: analyze_channels(stats_store, list(channel_ids), milestones=milestones)
+        for milestones, channel_ids in milestone_groups.items()
+    }
+    digests = {}
+    for tracker in youtube_trackers:
+        channel_info = channels.get(tracker['channel_id'])
+        if not channel_info:
+            continue
+        if tracker['channel_id'] in approximate:
+            sub_count_raw = channel_info['statistics'].get('subscriberCount')
+            if sub_count_raw and sub_count_raw.isdigit():
+                stats = {
+                    **dict.fromkeys(('change_24h', 'growth_7d', 'avg_7d', 'avg_30d', 'next_milestone', 'milestone_eta')),
+                    'current': int(sub_count_raw),
+                    'approximate': True
+                }
+                digests.setdefault(tracker['post_channel'], []).append((channel_info['snippet']['title'], stats))
+            continue
+        stats = metrics[tracker_milestones(tracker)].get(tracker['channel_id'])
+        if not stats:
+            continue
+        digests.setdefault(tracker['post_channel'], []).append((channel_info['snippet']['title'], stats))
+        tracker['last_count'] = stats['current']
+        try:
+            await check_milestone(tracker, tracker['last_count'])
+        except Exception as e:
+            print(f"[YouTube] Error checking milestones for {tracker.get('account_name')}: {e}")
+
+    for post_channel, entries in digests.items():
+        # Queued one embed at a time, the outbox packs them under Discord's per-message limits
+        for embed in build_stats_digest(entries):
+            await notification_outbox.add(post_channel, [embed])
+    await notification_outbox.flush_all()
+    save_tracker_state()
+    return True
+
+def build_stats_digest(entries: list) -> list:
+    """Daily digest embeds for one post channel from ``(channel_name, stats)`` entries, 25 per embed"""
+    embeds = []
+    for start in range(0, len(entries), 25):
+        embed = discord.Embed(
+            title="📊 Daily YouTube Stats Digest",
+            color=discord.Color.blue(),
+            timestamp=datetime.utcnow()
+        )
+        embed.set_thumbnail(url="https://i.imgur.com/krKzGz0.png")
+        for channel_name, stats in entries[start:start + 25]:
+            if stats.get('approximate'):
+                lines = [f"**Subscribers:** ~{stats['current']:,} (approximate)"]
+            else:
+                lines = [f"**Subscribers:** {stats['current']:,}"]
+            if stats['change_24h'] is not None:
+                growth_emoji = "📈" if stats['change_24h'] >= 0 else "📉"
+                lines.append(f"**24h Change:** {growth_emoji} {stats['change_24h']:+,}")
+            if stats['growth_7d'] is not None:
+                lines.append(f"**7d Growth:** {stats['growth_7d']:+.2f}%")
+            if stats['avg_7d'] is not None:
+                lines.append(f"**Avg/Day:** {stats['avg_7d']:+,.0f} (7d) · {stats['avg_30d']:+,.0f} (30d)")
+            if stats['milestone_eta'] is not None:
+                lines.append(f"**{stats['next_milestone']:,} Expected:** <t:{int(stats['milestone_eta'])}:D>")
+            embed.add_field(name=channel_name, value="\n".join(lines), inline=False)
+        embed.set_footer(text=f"Daily Update • {datetime.utcnow().strftime('%Y-%m-%d')}")
+        embeds.append(embed)
+    return embeds
 
 async def check_social_updates():
     """Check all social trackers for updates (except subscriber counts)"""
+    polled = False
+    for provider in social_providers.values():
+        try:
+            polled = await sweep_provider(provider) or polled
+        except Exception as e:
+            print(f"[{provider.label}] Sweep failed: {e}")
+
+    # Send what the sweep queued before saving, live message IDs are only known once it's out
+    await notification_outbox.flush_all()
+
+    # Save updates once per cycle, the snapshot too so a killed process keeps its stream sessions
+    if polled:
+        save_social_trackers()
+        save_tracker_state()
+
+async def sweep_provider(provider: PlatformProvider) -> bool:
+    """Poll one provider's due accounts in batches, returns whether anything was polled"""
+    # Account-level polling registry: every tracked account is polled once per
+    # cycle and the result fans out to each guild tracker subscribed to it
+    subscriptions = {}
     for guild_id, trackers in social_trackers.items():
         for tracker in trackers:
+            # Quarantined trackers only join the sweep for their occasional probe
+            if tracker['platform'] == provider.name and provider.wants(tracker) and tracker_poll_allowed(tracker):
+                subscriptions.setdefault(tracker['channel_id'], []).append((guild_id, tracker))
+
+    if not subscriptions or not provider.available():
+        return False
+
+    # Only accounts whose adaptive interval has elapsed are polled this cycle
+    due = {account_id: subscriptions[account_id] for account_id in provider.due(subscriptions)}
+    if not due:
+        return False
+
+    pending = set(due)
+    try:
+        poll_plan = provider.plan(due)
+        for account_id in pending - set(poll_plan):
+            provider.reschedule(account_id, due[account_id], delay=0)  # Deferred: stays due for the next cycle
+        pending &= set(poll_plan)
+        if not poll_plan:
+            social_poll_stats[provider.name] = {'channels_polled': 0, 'deferred': len(due)}
+            return False
+
+        calls_before = provider.api_calls_made()
+        api_calls_saved = 0
+        sweep_start = time.monotonic()
+        account_ids = list(poll_plan)
+        for start in range(0, len(account_ids), provider.max_batch):
+            batch = account_ids[start:start + provider.max_batch]
             try:
-                if tracker['platform'] == 'youtube':
-                    await check_youtube_update(guild_id, tracker)
-                await asyncio.sleep(1)
+                snapshots = await provider.fetch_many(batch, poll_plan, due)
             except Exception as e:
-                print(f"⚠️ Error in social update: {e}")
+                print(f"[{provider.label}] Error polling {len(batch)} account(s): {e}")
+                continue  # The batch stays queued
+
+            for account_id in batch:
+                if account_id not in snapshots:
+                    continue  # Failed, already reported by the provider
+                subscribers = due[account_id]
+                snapshot = snapshots[account_id]
+                if snapshot is None:
+                    print(f"[{provider.label}] No account found for ID: {account_id}")
+                    for guild_id, tracker in subscribers:
+                        await record_tracker_failure(guild_id, tracker, "ChannelNotFound", 1 / provider.max_batch)
+                    continue
+                api_calls_saved += snapshot.get('api_calls', 0) * (len(subscribers) - 1)
+                await dispatch_account(provider, account_id, subscribers, snapshot)
+                pending.discard(account_id)
+        sweep_seconds = time.monotonic() - sweep_start
+        api_calls = provider.api_calls_made() - calls_before
+    finally:
+        for account_id in pending:
+            provider.reschedule(account_id, due[account_id])
+
+    social_poll_stats[provider.name] = {
+        'trackers': sum(len(subscribers) for subscribers in subscriptions.values()),
+        'channels_due': len(due),
+        'channels_polled': len(poll_plan),
+        'deferred': len(due) - len(poll_plan),
+        'api_calls': api_calls,
+        'api_calls_saved': api_calls_saved,
+        'sweep_seconds': round(sweep_seconds, 2),
+        **provider.sweep_stats()
+    }
+    if sweep_seconds > SOCIAL_POLL_INTERVAL:
+        print(f"⚠️ [{provider.label}] Sweep of {len(poll_plan)} account(s) took {sweep_seconds:.1f}s, "
+              f"longer than the {SOCIAL_POLL_INTERVAL}s poll interval")
+    if api_calls_saved:
+        print(f"[{provider.label}] Polled {len(poll_plan)} account(s) for {social_poll_stats[provider.name]['trackers']} tracker(s): "
+              f"{api_calls} API calls, {api_calls_saved} saved by account dedupe")
+    return True
+
+async def dispatch_account(provider: PlatformProvider, account_id: str, subscribers, snapshot: dict):
+    """Fan an account's snapshot out to its trackers and schedule its next poll"""
+    share = snapshot.get('api_calls', 0) / len(subscribers)
+    for guild_id, tracker in subscribers:
+        if not bot.get_channel(int(tracker['post_channel'])):
+            await record_tracker_failure(guild_id, tracker, "PostChannelMissing", share)
+            continue
+        try:
+            await provider.apply(guild_id, tracker, snapshot)
+            record_tracker_success(tracker)
+        except Exception as e:
+            print(f"[{provider.label}] Error checking {tracker['account_name']}: {e}")
+            await record_tracker_failure(guild_id, tracker, type(e).__name__, share)
+
+    provider.reschedule(account_id, subscribers, snapshot)
+
+def due_youtube_channels(subscriptions: dict) -> list:
+    """Pop every channel whose next poll time has passed off the schedule heap"""
+    now_ts = datetime.utcnow().timestamp()
+    for channel_id in subscriptions:
+        if channel_id not in channel_schedule:
+            # Newly tracked channels are due immediately
+            channel_schedule[channel_id] = {'interval': MIN_POLL_INTERVAL, 'idle_polls': 0, 'next_due': now_ts}
+            heapq.heappush(poll_heap, (now_ts, channel_id))
+
+    due = []
+    while poll_heap and poll_heap[0][0] <= now_ts:
+        next_due, channel_id = heapq.heappop(poll_heap)
+        state = channel_schedule.get(channel_id)
+        if channel_id not in subscriptions:
+            channel_schedule.pop(channel_id, None)  # No longer tracked anywhere
+        elif state and state['next_due'] == next_due:
+            due.append(channel_id)
+        # Anything else is a stale entry left behind by a reschedule
+    return due
+
+def requeue_channel(channel_id: str, delay: float = None):
+    """Schedule a channel's next poll, by default one interval from now"""
+    state = channel_schedule[channel_id]
+    state['next_due'] = datetime.utcnow().timestamp() + (state['interval'] if delay is None else delay)
+    heapq.heappush(poll_heap, (state['next_due'], channel_id))
+
+def record_activity(tracker, timestamp: str):
+    """Count an upload or stream start in the tracker's hour-of-day activity histogram"""
+    if not timestamp:
+        return
+    hours = tracker.get('activity_hours') or [0] * 24
+    hours[datetime.fromisoformat(timestamp.replace('Z','')).hour] += 1
+    tracker['activity_hours'] = hours
+
+def near_usual_activity(subscribers) -> bool:
+    """Whether the current UTC hour is within an hour of the channel's usual upload/stream hours"""
+    hours = [0] * 24
+    for _, tracker in subscribers:
+        if 'activity_hours' not in tracker and tracker.get('stream_start_time'):
+            record_activity(tracker, tracker['stream_start_time'])
+        for hour, count in enumerate(tracker.get('activity_hours') or []):
+            hours[hour] += count
+
+    peak = max(hours)
+    if not peak:
+        return False
+    current = datetime.utcnow().hour
+    return any(hours[(current + offset) % 24] >= max(1, peak // 4) for offset in (-1, 0, 1))
+
+def adapt_poll_interval(channel_id: str, subscribers, snapshot: dict) -> int:
+    """Poll fast while live or near usual activity hours, back off exponentially when idle"""
+    state = channel_schedule[channel_id]
+    last_poll = channel_poll_times.get(channel_id, 0)
+    uploaded = any(
+        datetime.fromisoformat(upload['published'].replace('Z','')).timestamp() > last_poll
+        for upload in snapshot['uploads'] or []
+    )
+    live = snapshot['live_video_id'] or any(tracker.get('last_live_video_id') for _, tracker in subscribers)
+
+    state['idle_polls'] = 0 if (uploaded or live) else state['idle_polls'] + 1
+    if live or near_usual_activity(subscribers):
+        state['interval'] = MIN_POLL_INTERVAL
+    else:
+        # Double the interval for every IDLE_BACKOFF_POLLS polls without activity
+        backoff = 2 ** (state['idle_polls'] // IDLE_BACKOFF_POLLS)
+        state['interval'] = min(MIN_POLL_INTERVAL * backoff, MAX_POLL_INTERVAL)
+    return state['interval']
 
 async def social_update_task():
     await bot.wait_until_ready()
@@ -548,9 +957,9 @@ async def social_update_task():
             
             # Check if we haven't done today's update and it's past 2:30 AM UTC
             if last_sub_check.date() < now.date() and current_time >= target_time:
-                await check_subscriber_counts()
-                last_sub_check = now
-                print(f"✅ Daily subscriber counts updated at {now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+                if await check_subscriber_counts():
+                    last_sub_check = now
+                    print(f"✅ Daily subscriber counts updated at {now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
             
             # Regular live stream and video checks
             await check_social_updates()
@@ -564,7 +973,7 @@ async def social_update_task():
             await asyncio.sleep(wait_time)
             continue
             
-        await asyncio.sleep(30)  # Check more frequently for live streams
+        await asyncio.sleep(SOCIAL_POLL_INTERVAL)  # Check more frequently for live streams
 
 async def event_schedule_notifier():
     await bot.wait_until_ready()
@@ -610,190 +1019,752 @@ async def event_schedule_notifier():
         
         await asyncio.sleep(60)
 
-async def check_youtube_update(guild_id, tracker):
-    if not youtube_service:
+QUARANTINE_FAILURES = 5            # Consecutive failures before a tracker is quarantined...
+QUARANTINE_AFTER = 3600            # ...provided it hasn't succeeded for this long
+QUARANTINE_PROBE_INTERVAL = 6 * 3600  # Seconds between probes of a quarantined tracker
+
+def platform_label(tracker) -> str:
+    provider = social_providers.get(tracker['platform'])
+    return provider.label if provider else tracker['platform'].title()
+
+def tracker_poll_allowed(tracker) -> bool:
+    health = tracker.get('health', {})
+    return not health.get('quarantined') or datetime.utcnow().timestamp() >= health.get('next_probe', 0)
+
+def record_tracker_success(tracker):
+    health = tracker.setdefault('health', {})
+    if health.get('quarantined'):
+        print(f"[{platform_label(tracker)}] {tracker['account_name']} recovered, leaving quarantine")
+    health.pop('failing_since', None)
+    health.update({
+        'failures': 0,
+        'last_success': datetime.utcnow().timestamp(),
+        'quarantined': False,
+        'notified': False
+    })
+
+async def record_tracker_failure(guild_id: str, tracker, error: str, wasted_calls: float = 0):
+    """Count a failed poll against a tracker and quarantine it once it keeps failing"""
+    now_ts = datetime.utcnow().timestamp()
+    health = tracker.setdefault('health', {})
+    health['failures'] = health.get('failures', 0) + 1
+    health['last_error'] = error
+    health['last_failure'] = now_ts
+    health['wasted_calls'] = round(health.get('wasted_calls', 0) + wasted_calls, 2)
+    if health['failures'] == 1:
+        health['failing_since'] = now_ts
+
+    if health.get('quarantined'):
+        health['next_probe'] = now_ts + QUARANTINE_PROBE_INTERVAL
+        return
+    if health['failures'] < QUARANTINE_FAILURES or now_ts - health['failing_since'] < QUARANTINE_AFTER:
+        return
+
+    health['quarantined'] = True
+    health['quarantined_at'] = now_ts
+    health['next_probe'] = now_ts + QUARANTINE_PROBE_INTERVAL
+    print(f"[{platform_label(tracker)}] Quarantined {tracker['account_name']} in guild {guild_id} after {health['failures']} failures ({error})")
+    if health.get('notified'):
         return
 
+    guild = bot.get_guild(int(guild_id))
+    channel = bot.get_channel(int(tracker['post_channel'])) or (guild.system_channel if guild else None)
+    if not channel:
+        return
     try:
-        # First get channel info
-        request = youtube_service.channels().list(
-            part='statistics,snippet',
-            id=tracker['channel_id']
-        )
-        response = request.execute()
+        await channel.send(embed=create_embed(
+            title="⚠️ Tracker Paused",
+            description=(
+                f"The tracker for **{tracker['account_name']}** failed {health['failures']} times in a row "
+                f"(`{error}`) and is now only checked every {QUARANTINE_PROBE_INTERVAL // 3600} hours.\n"
+                f"Fix the post channel or remove it with `/remove-social-tracker`."
+            ),
+            color=discord.Color.orange()
+        ))
+        health['notified'] = True
+    except discord.HTTPException as e:
+        print(f"[{platform_label(tracker)}] Couldn't notify guild {guild_id} about quarantine: {e}")
+
+async def tracker_webhook(channel):
+    """The bot's cached webhook for a post channel, created on first use (None if unavailable)"""
+    if channel.id in channel_webhooks:
+        return channel_webhooks[channel.id]
+    webhook = None
+    if isinstance(channel, discord.TextChannel):
+        try:
+            webhook = next(
+                (hook for hook in await channel.webhooks() if hook.name == TRACKER_WEBHOOK_NAME and hook.token),
+                None
+            ) or await channel.create_webhook(name=TRACKER_WEBHOOK_NAME, reason="Social tracker notifications")
+        except discord.HTTPException as e:
+            print(f"⚠️ Can't use a webhook in #{channel.name}, sending as the bot: {e}")
+    # Channels without one (no Manage Webhooks permission, threads) are remembered too
+    channel_webhooks[channel.id] = webhook
+    return webhook
+
+async def deliver_notification(post_channel, username=None, avatar_url=None, **kwargs):
+    """Post one (possibly coalesced) notification message to a post channel"""
+    channel = bot.get_channel(int(post_channel))
+    if not channel:
+        return None
+    if TRACKER_DELIVERY == "webhook":
+        webhook = await tracker_webhook(channel)
+        if webhook:
+            try:
+                # Posted under the tracked account's name and avatar, off the bot's send buckets
+                return await webhook.send(username=username, avatar_url=avatar_url, wait=True, **kwargs)
+            except discord.NotFound:
+                channel_webhooks.pop(channel.id, None)  # Deleted, recreated on the next notification
+                for file in kwargs.get('files') or []:
+                    file.reset()  # The failed upload read them to the end
+    return await channel.send(**kwargs)
+
+notification_outbox = NotificationOutbox(deliver_notification, NOTIFY_COALESCE_WINDOW)
+
+async def send_tracker_notification(tracker, embed, content=None, files=None, allowed_mentions=None, on_sent=None):
+    """Queue a notification for a tracker's post channel, coalesced with others headed there"""
+    await notification_outbox.add(
+        tracker['post_channel'],
+        [embed],
+        content=content,
+        files=files,
+        allowed_mentions=allowed_mentions,
+        username=tracker.get('channel_name') or tracker['account_name'],
+        avatar_url=tracker.get('avatar_url'),
+        on_sent=on_sent
+    )
 
-        if not response.get('items'):
-            print(f"[YouTube] No channel found for ID: {tracker['channel_id']}")
-            return
+# notification_settings keys that each need API calls while polling
+POLLED_FEATURES = {
+    'uploads': ('new_videos',),
+    'live': ('live_streams', 'stream_updates', 'stream_end')
+}
+def tracker_milestones(tracker) -> tuple:
+    """The tracker's subscriber milestones, ascending"""
+    return tuple(sorted(tracker.get('milestone_thresholds') or DEFAULT_MILESTONES))
+
+def notification_enabled(tracker, setting: str) -> bool:
+    return tracker.get('notification_settings', {}).get(setting, True)
+
+async def check_milestone(tracker, subscribers: int):
+    """Announce a crossed subscriber milestone, exactly once per threshold.
+
+    next_milestone is kept on the tracker, so the usual check is a single
+    comparison and the threshold list is only bisected once it's reached.
+    The first check for a tracker records where it stands without announcing.
+    """
+    if 'next_milestone' in tracker and (tracker['next_milestone'] is None or subscribers < tracker['next_milestone']):
+        return
+
+    thresholds = tracker_milestones(tracker)
+    index = bisect_right(thresholds, subscribers)
+    announce = 'next_milestone' in tracker and index > 0
+    tracker['next_milestone'] = thresholds[index] if index < len(thresholds) else None
 
-        channel_info = response['items'][0]
-        stats = channel_info['statistics']
-        snippet = channel_info['snippet']
-        channel_name = snippet['title']
+    if announce and notification_enabled(tracker, 'subscriber_milestones'):
+        embed = discord.Embed(
+            title=f"🎉 {tracker['account_name']} hit {thresholds[index - 1]:,} subscribers!",
+            url=tracker['url'],
+            description=f"**Current Subscribers:** {subscribers:,}",
+            color=discord.Color.gold(),
+            timestamp=datetime.utcnow()
+        )
+        await send_tracker_notification(tracker, embed=embed)
 
-        # Update last check time
-        tracker['last_check_time'] = datetime.utcnow().timestamp()
+def tracker_features(tracker) -> set:
+    """The polled features ("uploads", "live") this tracker has at least one notification enabled for"""
+    return {
+        feature for feature, settings in POLLED_FEATURES.items()
+        if any(notification_enabled(tracker, setting) for setting in settings)
+    }
 
-        # We don't handle subscriber counts here anymore as it's done in daily updates
-        tracker['channel_name'] = channel_name  # Store channel name for other notifications
+def channel_features(subscribers) -> set:
+    return set().union(*(tracker_features(tracker) for _, tracker in subscribers))
+
+def estimate_poll_cost(channel_id: str, check_live: bool, features: set = frozenset(POLLED_FEATURES)) -> float:
+    """Estimated quota units for polling one channel"""
+    cost = 1 / MAX_IDS_PER_REQUEST  # Share of the batched channels lookup
+    if 'uploads' in features and not youtube_feed_poller and not (websub and websub.is_active(channel_id)):
+        cost += call_cost('playlistItems', 'list')
+    if check_live and 'live' in features:
+        cost += call_cost('search', 'list') + call_cost('videos', 'list')
+    return cost
+
+def plan_youtube_polls(subscriptions: dict, cost) -> dict:
+    """Pick the channels this cycle can afford, round-robin across guilds and by priority.
+
+    ``cost(channel_id, full, subscribers)`` estimates the quota units of one poll.
+    """
+    guild_channels = {}
+    priorities = {}
+    for channel_id, subscribers in subscriptions.items():
+        for guild_id, tracker in subscribers:
+            priority = tracker.get('priority', 0)
+            priorities[channel_id] = max(priorities.get(channel_id, priority), priority)
+            guild_channels.setdefault(guild_id, []).append((priority, channel_id))
+
+    # Within a guild: highest priority first, then the channel polled longest ago
+    for guild_id, channels in guild_channels.items():
+        channels.sort(key=lambda entry: (-entry[0], channel_poll_times.get(entry[1], 0)))
+        guild_channels[guild_id] = [channel_id for _, channel_id in channels]
+
+    return quota_planner.plan(
+        guild_channels,
+        priorities,
+        light_cost=lambda channel_id: cost(channel_id, False, subscriptions[channel_id]),
+        full_cost=lambda channel_id: cost(channel_id, True, subscriptions[channel_id])
+    )
 
-        # Video upload detection (only notify for videos <8 hours old)
-        video_request = youtube_service.search().list(
-            part="snippet",
-            channelId=tracker['channel_id'],
-            order="date",
+async def poll_youtube_channel(channel_id: str, channel_info: dict, check_uploads: bool = True,
+                               check_live: bool = True, scraping: bool = False) -> dict:
+    """Fetch a channel's recent uploads and live status once for all of its trackers"""
+    api_calls = 0
+    if scraping:
+        return {
+            'uploads': await youtube_scraper.fetch_uploads(channel_id) if check_uploads else None,
+            'live_video_id': await youtube_scraper.find_live_video(channel_id) if check_live else None,
+            'live_details': None,
+            'api_calls': 0
+        }
+
+    # Upload detection reads the Atom feed (free) or the uploads playlist (1 unit)
+    # instead of search (100 units). Channels with a WebSub lease get uploads pushed,
+    # so polling them only runs as an occasional fallback.
+    now_ts = datetime.utcnow().timestamp()
+    if not check_uploads:
+        uploads = None
+    elif websub and websub.is_active(channel_id) and now_ts - upload_poll_times.get(channel_id, 0) < WEBSUB_FALLBACK_INTERVAL:
+        uploads = None
+    elif youtube_feed_poller:
+        uploads = await youtube_feed_poller.fetch_uploads(channel_id)
+    else:
+        try:
+            playlist_response = await youtube_client.call(
+                'playlistItems', 'list',
+                part="snippet,contentDetails",
+                playlistId=uploads_playlist_id(channel_id, channel_info),
+                maxResults=UPLOADS_PAGE_SIZE,
+                fields=PLAYLIST_UPLOADS_FIELDS
+            )
+        except HttpError as e:
+            if e.resp.status != 404:
+                raise
+            playlist_response = {}  # Channel has no uploads playlist yet
+        api_calls += 1
+        uploads = parse_playlist_uploads(playlist_response)
+    if uploads is not None:
+        upload_poll_times[channel_id] = now_ts
+
+    # Check for live streams, skipped when the quota plan only affords a light poll.
+    # Stream details are looked up later in one batch across every channel.
+    live_video_id = None
+    if check_live:
+        search_response = await youtube_client.call(
+            'search', 'list',
+            part="id",
+            channelId=channel_id,
+            eventType="live",
+            type="video",
             maxResults=1,
-            type="video"
+            fields=LIVE_SEARCH_FIELDS
         )
-        video_response = video_request.execute()
+        api_calls += 1
+        if search_response.get('items'):
+            live_video_id = search_response['items'][0]['id']['videoId']
 
-        if video_response.get('items'):
-            latest_video = video_response['items'][0]
-            video_id = latest_video['id']['videoId']
-            publish_time = latest_video['snippet']['publishedAt']
-            video_time = datetime.fromisoformat(publish_time.replace('Z',''))
+    return {
+        'uploads': uploads,
+        'live_video_id': live_video_id,
+        'live_details': None,
+        'api_calls': api_calls
+    }
 
-            # Only notify if video is <8 hours old and not previously notified
-            if (datetime.utcnow() - video_time) < timedelta(hours=8) and tracker.get("last_video_id") != video_id:
-                embed = discord.Embed(
-                    title=f"📺 New YouTube Video: {latest_video['snippet']['title']}",
-                    url=f"https://youtu.be/{video_id}",
-                    description=f"A new video was uploaded on {tracker['account_name']}!",
-                    color=discord.Color.red(),
-                    timestamp=datetime.utcnow()
-                )
-                embed.add_field(name="Channel", value=tracker['account_name'], inline=True)
-                embed.add_field(name="Published", value=f"<t:{int(video_time.timestamp())}:R>", inline=True)
-                embed.set_image(url=latest_video['snippet']['thumbnails']['high']['url'])
+def new_uploads(tracker, uploads: list) -> list:
+    """Return uploads this tracker hasn't seen yet, oldest first, and remember them"""
+    seen = tracker.get('seen_video_ids')
+    if seen is None:
+        # First diff for this tracker: everything up to last_video_id was already
+        # handled, and without one only the newest upload is a candidate
+        ids = [upload['video_id'] for upload in uploads]
+        if tracker.get('last_video_id') in ids:
+            seen = ids[ids.index(tracker['last_video_id']):][::-1]
+        else:
+            seen = ids[1:][::-1]
 
-                channel = bot.get_channel(int(tracker['post_channel']))
-                if channel:
-                    await channel.send(embed=embed)
+    seen_set = set(seen)
+    fresh = [upload for upload in reversed(uploads) if upload['video_id'] not in seen_set]
+    seen.extend(upload['video_id'] for upload in fresh)
+    tracker['seen_video_ids'] = seen[-SEEN_VIDEO_WINDOW:]
+    return fresh
 
-                tracker['last_video_id'] = video_id
+async def notify_new_uploads(tracker, uploads: list):
+    """Announce this tracker's unseen uploads (only videos <8 hours old)"""
+    for upload in new_uploads(tracker, uploads):
+        video_id = upload['video_id']
+        video_time = datetime.fromisoformat(upload['published'].replace('Z',''))
 
-        # Enhanced Live stream detection with real-time updates
-        now_ts = datetime.utcnow().timestamp()
-        last_live_notify = tracker.get('last_live_notify_time', 0)
-        
-        # Get detailed live stream info
-        live_request = youtube_service.videos().list(
-            part="snippet,liveStreamingDetails,statistics",
-            id=tracker.get('last_live_video_id', '')
-        ) if tracker.get('last_live_video_id') else None
-        
-        live_details = None
-        if live_request:
-            try:
-                live_response = live_request.execute()
-                if live_response.get('items'):
-                    live_details = live_response['items'][0]
-            except Exception as e:
-                print(f"Error getting live details: {e}")
+        if (datetime.utcnow() - video_time) < timedelta(hours=8):
+            embed = discord.Embed(
+                title=f"📺 New YouTube Video: {upload['title']}",
+                url=f"https://youtu.be/{video_id}",
+                description=f"A new video was uploaded on {tracker['account_name']}!",
+                color=discord.Color.red(),
+                timestamp=datetime.utcnow()
+            )
+            embed.add_field(name="Channel", value=tracker['account_name'], inline=True)
+            embed.add_field(name="Published", value=f"<t:{int(video_time.timestamp())}:R>", inline=True)
+            if upload['thumbnail']:
+                embed.set_image(url=upload['thumbnail'])
+
+            await send_tracker_notification(tracker, embed=embed)
+
+            record_activity(tracker, upload['published'])
+
+        tracker['last_video_id'] = video_id
+
+async def handle_pushed_uploads(uploads: list):
+    """Feed WebSub-pushed uploads straight into the tracker notification path"""
+    for upload in uploads:
+        if upload['channel_id'] in channel_schedule:
+            channel_schedule[upload['channel_id']]['idle_polls'] = 0
+        for trackers in social_trackers.values():
+            for tracker in trackers:
+                if tracker['platform'] != 'youtube' or tracker['channel_id'] != upload['channel_id']:
+                    continue
+                # Same gates as a polled upload: video alerts on, tracker not quarantined
+                if not notification_enabled(tracker, 'new_videos') or not tracker_poll_allowed(tracker):
+                    continue
+                try:
+                    await notify_new_uploads(tracker, [upload])
+                except Exception as e:
+                    print(f"[WebSub] Error notifying {tracker['account_name']}: {e}")
+    save_social_trackers()
 
-        # Check for new live streams
-        search_request = youtube_service.search().list(
-            part="snippet",
-            channelId=tracker['channel_id'],
-            eventType="live",
-            type="video",
-            maxResults=1
+async def websub_lease_task():
+    """Subscribe every tracked channel to WebSub pushes and renew leases before they expire"""
+    await bot.wait_until_ready()
+    while not bot.is_closed():
+        try:
+            channel_ids = {
+                tracker['channel_id'] for trackers in social_trackers.values()
+                for tracker in trackers if tracker['platform'] == 'youtube'
+            }
+            sent = await websub.renew(channel_ids)
+            if sent:
+                print(f"[WebSub] Sent {sent} subscription request(s)")
+        except Exception as e:
+            print(f"⚠️ WebSub lease renewal error: {e}")
+        await asyncio.sleep(600)
+
+def stream_is_live(video: dict) -> bool:
+    details = (video or {}).get('liveStreamingDetails', {})
+    return bool(details.get('actualStartTime')) and not details.get('actualEndTime')
+
+def stream_has_ended(video: dict) -> bool:
+    # A stream missing from the lookup was deleted or made private
+    return video is None or bool(video.get('liveStreamingDetails', {}).get('actualEndTime'))
+
+STREAM_SESSION_MAX_IDLE = 86400  # Drop sessions of streams that vanished without an end time
+
+def record_stream_samples(live_details: dict):
+    """Add a viewer sample to the session of every stream that's live in this lookup"""
+    now_ts = datetime.utcnow().timestamp()
+    for video_id, video in live_details.items():
+        if not stream_is_live(video):
+            continue
+        details = video['liveStreamingDetails']
+        session = stream_sessions.get(video_id)
+        if session is None:
+            started_at = datetime.fromisoformat(details['actualStartTime'].replace('Z', '')).timestamp()
+            session = stream_sessions[video_id] = StreamSession(video_id, started_at)
+        session.add(now_ts, int(details.get('concurrentViewers', '0')))
+
+def prune_stream_sessions(live_details: dict):
+    """Forget sessions of streams seen ending in an earlier batch, whose trackers have been dispatched since"""
+    now_ts = datetime.utcnow().timestamp()
+    for video_id, session in list(stream_sessions.items()):
+        idle = not session.last_sample or now_ts - session.last_sample[0] > STREAM_SESSION_MAX_IDLE
+        if video_id in ended_streams or idle:
+            stream_sessions.pop(video_id, None)
+            ended_streams.discard(video_id)
+    ended_streams.update(
+        video_id for video_id, video in live_details.items()
+        if video_id in stream_sessions and stream_has_ended(video)
+    )
+
+async def stream_summary(video_id: str):
+    """Peak/average fields and a rendered viewer chart for a finished stream, if it was sampled"""
+    session = stream_sessions.get(video_id)
+    if not session or not session.samples:
+        return None, None
+    if session.chart_png is None:
+        # Pillow rendering is CPU-bound, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        session.chart_png = await loop.run_in_executor(None, render_viewer_chart, list(session.samples))
+    fields = [
+        ("👥 Peak Viewers", f"{session.peak:,}" + (f" at <t:{int(session.peak_at)}:t>" if session.peak_at else "")),
+        ("📊 Average Viewers", f"{session.average:,}")
+    ]
+    return fields, session.chart_png
+
+LIVE_EDIT_MIN_INTERVAL = 60        # Seconds between edits of a live message
+LIVE_EDIT_MAX_INTERVAL = 600       # Refresh the duration at least this often
+LIVE_EDIT_VIEWER_CHANGE = 0.05     # Relative viewer change worth an early edit
+
+def build_live_embed(tracker, video_id: str, video: dict, ended: bool = False) -> discord.Embed:
+    """The live notification embed, or its finalized form once the stream is over"""
+    snippet = video['snippet']
+    details = video['liveStreamingDetails']
+    thumbnails = snippet['thumbnails']
+    live_thumb = (thumbnails.get('maxres') or thumbnails.get('high') or thumbnails.get('default', {})).get('url')
+    stream_start = details.get('actualStartTime')
+
+    if ended:
+        embed = discord.Embed(
+            title=f"📺 Stream Ended - {tracker['account_name']}",
+            url=f"https://youtu.be/{video_id}",
+            description=f"**{snippet['title']}**\n\n" +
+                     (f"⏰ **Streamed For:** {format_duration(stream_start, details.get('actualEndTime'))}" if stream_start else ""),
+            color=discord.Color.blue(),
+            timestamp=datetime.utcnow()
+        )
+    else:
+        current_viewers = int(details.get('concurrentViewers', '0'))
+        embed = discord.Embed(
+            title=f"🔴 {tracker['account_name']} is LIVE!",
+            url=f"https://youtu.be/{video_id}",
+            description=f"**{snippet['title']}**\n\n" + 
+                     f"👥 **Current Viewers:** {current_viewers:,}\n" +
+                     (f"⏰ **Stream Duration:** {format_duration(stream_start)}" if stream_start else ""),
+            color=discord.Color.red(),
+            timestamp=datetime.utcnow()
         )
-        search_response = search_request.execute()
 
-        if search_response.get('items'):
-            live_video = search_response['items'][0]
-            live_video_id = live_video['id']['videoId']
-            live_title = live_video['snippet']['title']
-            live_thumb = live_video['snippet']['thumbnails']['maxres']['url'] if 'maxres' in live_video['snippet']['thumbnails'] else live_video['snippet']['thumbnails']['high']['url']
-            
-            # Get detailed stream info including viewer count
-            video_request = youtube_service.videos().list(
-                part="snippet,liveStreamingDetails,statistics",
-                id=live_video_id
-            )
-            video_response = video_request.execute()
-            
-            if video_response.get('items'):
-                stream_details = video_response['items'][0]
-                current_viewers = stream_details.get('liveStreamingDetails', {}).get('concurrentViewers', '0')
-                stream_start = stream_details.get('liveStreamingDetails', {}).get('actualStartTime')
+    embed.add_field(name="Channel", value=tracker['account_name'], inline=True)
+    if stream_start:
+        embed.add_field(name="Started", value=f"<t:{int(datetime.fromisoformat(stream_start.replace('Z','')).timestamp())}:R>", inline=True)
+
+    if live_thumb:
+        embed.set_image(url=live_thumb)
+    embed.set_footer(text="Thanks for watching!" if ended else "🎮 Join the stream now!")
+    return embed
+
+def live_edit_due(tracker, viewers: int, now_ts: float) -> bool:
+    """Coalesce live message edits: only for a real viewer change, or to refresh the duration"""
+    since_edit = now_ts - tracker.get('last_live_notify_time', 0)
+    if since_edit < LIVE_EDIT_MIN_INTERVAL:
+        return False
+    last_viewers = tracker.get('live_message_viewers', 0)
+    changed = abs(viewers - last_viewers) >= max(10, last_viewers * LIVE_EDIT_VIEWER_CHANGE)
+    return changed or since_edit >= LIVE_EDIT_MAX_INTERVAL
+
+async def edit_live_message(tracker, **kwargs) -> bool:
+    """Edit the tracker's live message, forgetting it if it was deleted or can't be edited"""
+    channel = bot.get_channel(int(tracker['post_channel']))
+    if not channel:
+        return False
+    message_id = int(tracker['live_message_id'])
+    try:
+        webhook = None
+        if tracker.get('live_message_webhook'):
+            # Only the webhook that posted a message can edit it
+            webhook = await tracker_webhook(channel)
+            if not webhook:
+                tracker.pop('live_message_id', None)
+                return False
+
+        embed_index = tracker.get('live_message_embed')
+        if embed_index is not None:
+            # Coalesced with other notifications: swap only this tracker's embed, keep their pings and files
+            message = await (webhook.fetch_message(message_id) if webhook else channel.fetch_message(message_id))
+            embeds = message.embeds
+            if embed_index >= len(embeds):
+                tracker.pop('live_message_id', None)
+                return False
+            embeds[embed_index] = kwargs.pop('embed')
+            kwargs['embeds'] = embeds
+            kwargs.pop('content', None)
+            if 'attachments' in kwargs:
+                replaced = {file.filename for file in kwargs['attachments']}
+                kwargs['attachments'] = [
+                    attachment for attachment in message.attachments if attachment.filename not in replaced
+                ] + kwargs['attachments']
+
+        if webhook:
+            await webhook.edit_message(message_id, **kwargs)
+        else:
+            await channel.get_partial_message(message_id).edit(**kwargs)
+        return True
+    except discord.HTTPException as e:
+        # Deleted, or unreadable (coalesced messages need Read Message History): stop editing
+        # it, and a stream-ended card gets posted as a new message instead
+        if not isinstance(e, discord.NotFound):
+            print(f"[{platform_label(tracker)}] Couldn't edit the live message of {tracker['account_name']}: {e}")
+        tracker.pop('live_message_id', None)
+        return False
+
+async def finish_live_message(tracker, video: dict):
+    """Turn the live message into the stream-ended card, or post one if there's no message"""
+    chart_png = None
+    if video:
+        embed = build_live_embed(tracker, video['id'], video, ended=True)
+        fields, chart_png = await stream_summary(video['id'])
+        for name, value in fields or []:
+            embed.add_field(name=name, value=value, inline=True)
+        if chart_png:
+            embed.set_thumbnail(url=embed.image.url)
+            embed.set_image(url=f"attachment://viewers-{video['id']}.png")
+    else:
+        # Deleted or made private, nothing left to report on
+        embed = discord.Embed(
+            title=f"📺 Stream Ended - {tracker['account_name']}",
+            description="The live stream has ended.",
+            color=discord.Color.blue(),
+            timestamp=datetime.utcnow()
+        )
+
+    def chart_files():
+        # A discord.File is consumed by one upload, so every request gets its own, named
+        # per stream so the charts of several streams can share a coalesced message
+        return [discord.File(io.BytesIO(chart_png), filename=f"viewers-{video['id']}.png")] if chart_png else []
+
+    tracker.pop('live_message_viewers', None)
+    if tracker.get('live_message_id'):
+        finalized = await edit_live_message(tracker, content=None, embed=embed, attachments=chart_files())
+        tracker.pop('live_message_id', None)
+        tracker.pop('live_message_embed', None)
+        if finalized:
+            return
+    if notification_enabled(tracker, 'stream_end'):
+        await send_tracker_notification(tracker, embed=embed, files=chart_files())
+
+async def check_youtube_update(guild_id, tracker, channel_info, snapshot):
+    """Apply a polled channel snapshot to one guild's tracker and send its notifications"""
+    snippet = channel_info['snippet']
+    channel_name = snippet['title']
+
+    # Update last check time
+    tracker['last_check_time'] = datetime.utcnow().timestamp()
+
+    # We don't handle subscriber counts here anymore as it's done in daily updates
+    if tracker.get('channel_name') != channel_name:
+        tracker['channel_name'] = channel_name  # Store channel name for other notifications
+    avatar_url = snippet.get('thumbnails', {}).get('default', {}).get('url')
+    if avatar_url:
+        tracker['avatar_url'] = avatar_url  # Webhook delivery posts with the channel's avatar
+
+    if snapshot['uploads'] is not None and notification_enabled(tracker, 'new_videos'):
+        await notify_new_uploads(tracker, snapshot['uploads'])
+
+    live_details = snapshot['live_details']
+    if live_details is None:
+        # Live details lookup failed this cycle
+        tracker['last_update_time'] = datetime.utcnow().timestamp()
+        return
+
+    # Enhanced Live stream detection with real-time updates
+    now_ts = datetime.utcnow().timestamp()
+    stored_live_id = tracker.get('last_live_video_id')
+
+    # The stored stream's own details say whether it's still running, so a
+    # light poll (no live search) keeps an ongoing stream updated as well
+    live_video_id = snapshot['live_video_id']
+    if not live_video_id and stream_is_live(live_details.get(stored_live_id)):
+        live_video_id = stored_live_id
+
+    # If was live but now ended, the live message is finalized in place
+    if stored_live_id and stored_live_id != live_video_id and stream_has_ended(live_details.get(stored_live_id)):
+        tracker['last_live_video_id'] = None
+        await finish_live_message(tracker, live_details.get(stored_live_id))
+
+    stream_details = live_details.get(live_video_id)
+    if live_video_id and stream_is_live(stream_details):
+        current_viewers = int(stream_details['liveStreamingDetails'].get('concurrentViewers', '0'))
+        stream_start = stream_details['liveStreamingDetails'].get('actualStartTime')
+
+        if tracker.get('last_live_video_id') != live_video_id:
+            # New stream: one message, pinged once, then kept up to date by edits
+            tracker.pop('live_message_id', None)
+            if notification_enabled(tracker, 'live_streams'):
+                ping_type = tracker.get('live_ping_type', 'everyone')  # Default to @everyone
+                content = {
+                    'everyone': '@everyone',
+                    'here': '@here',
+                    'none': None
+                }.get(ping_type, '@everyone')
                 
-                # Determine if this is a new stream or if we should send an update
-                should_notify = (
-                    tracker.get('last_live_video_id') != live_video_id or
-                    (now_ts - last_live_notify) > 300  # Update every 5 minutes
+                def remember_live_message(message, embed_index, shared):
+                    tracker['live_message_id'] = str(message.id)
+                    tracker['live_message_webhook'] = isinstance(message, discord.WebhookMessage)
+                    if shared:
+                        tracker['live_message_embed'] = embed_index
+                    else:
+                        tracker.pop('live_message_embed', None)
+
+                await send_tracker_notification(
+                    tracker,
+                    content=content,
+                    embed=build_live_embed(tracker, live_video_id, stream_details),
+                    allowed_mentions=discord.AllowedMentions(everyone=True) if content else None,
+                    on_sent=remember_live_message
                 )
 
-                if should_notify:
-                    # Create rich embed for live notification
-                    embed = discord.Embed(
-                        title=f"🔴 {tracker['account_name']} is LIVE!",
-                        url=f"https://youtu.be/{live_video_id}",
-                        description=f"**{live_title}**\n\n" + 
-                                 f"👥 **Current Viewers:** {current_viewers:,}\n" +
-                                 (f"⏰ **Stream Duration:** {format_duration(stream_start)}" if stream_start else ""),
-                        color=discord.Color.red(),
-                        timestamp=datetime.utcnow()
-                    )
-                    
-                    embed.add_field(name="Channel", value=tracker['account_name'], inline=True)
-                    if stream_start:
-                        embed.add_field(name="Started", value=f"<t:{int(datetime.fromisoformat(stream_start.replace('Z','')).timestamp())}:R>", inline=True)
-                    
-                    embed.set_image(url=live_thumb)
-                    embed.set_footer(text="🎮 Join the stream now!")
-
-                    # Send notification with custom ping settings
-                    channel = bot.get_channel(int(tracker['post_channel']))
-                    if channel:
-                        ping_type = tracker.get('live_ping_type', 'everyone')  # Default to @everyone
-                        content = {
-                            'everyone': '@everyone',
-                            'here': '@here',
-                            'none': None
-                        }.get(ping_type, '@everyone')
-                        
-                        await channel.send(
-                            content=content,
-                            embed=embed,
-                            allowed_mentions=discord.AllowedMentions(everyone=True) if content else None
-                        )
+            record_activity(tracker, stream_start)
+            tracker['last_live_video_id'] = live_video_id
+            tracker['last_live_notify_time'] = now_ts
+            tracker['live_message_viewers'] = current_viewers
+            tracker['stream_start_time'] = stream_start  # Track stream start time
+        elif (tracker.get('live_message_id') and notification_enabled(tracker, 'stream_updates')
+              and live_edit_due(tracker, current_viewers, now_ts)):
+            if await edit_live_message(tracker, embed=build_live_embed(tracker, live_video_id, stream_details)):
+                tracker['last_live_notify_time'] = now_ts
+                tracker['live_message_viewers'] = current_viewers
+
+    tracker['last_update_time'] = datetime.utcnow().timestamp()
+
+class YouTubeProvider(PlatformProvider):
+    """YouTube channels, through the Data API client or the key-less scraper"""
+
+    name = 'youtube'
+    label = 'YouTube'
+    max_batch = MAX_IDS_PER_REQUEST
+
+    def available(self) -> bool:
+        # While the quota circuit breaker is open the scraper takes over, and without
+        # one due channels simply stay queued on the heap
+        return youtube_source() is not None
+
+    def wants(self, tracker) -> bool:
+        # Trackers with uploads and live alerts both switched off never cost a poll
+        return bool(tracker_features(tracker))
+
+    def cost(self, channel_id: str, full: bool, subscribers) -> float:
+        return estimate_poll_cost(channel_id, full, channel_features(subscribers))
+
+    def due(self, subscriptions: dict) -> list:
+        return due_youtube_channels(subscriptions)
+
+    def plan(self, due: dict) -> dict:
+        # Spend only this cycle's share of the daily quota, shared fairly across guilds.
+        # Scraping costs no quota, its per-host rate cap paces it instead.
+        if youtube_source() is youtube_scraper:
+            return {channel_id: 'full' for channel_id in due}
+        return plan_youtube_polls(due, self.cost)
+
+    def api_calls_made(self) -> int:
+        return youtube_client.calls if youtube_client else 0
+
+    async def fetch_many(self, channel_ids: list, plan: dict, subscriptions: dict) -> dict:
+        source = youtube_source()
+        scraping = source is youtube_scraper
+
+        # Titles and uploads playlists rarely change: served from the metadata cache,
+        # with one channels.list call per 50 expired channels
+        youtube_channels = await source.fetch_channel_metadata(channel_ids)
+        semaphore = asyncio.Semaphore(SOCIAL_SWEEP_CONCURRENCY)
+
+        async def sweep_channel(channel_id):
+            features = channel_features(subscriptions[channel_id])
+            async with semaphore:
+                return await asyncio.wait_for(
+                    poll_youtube_channel(
+                        channel_id,
+                        youtube_channels[channel_id],
+                        check_uploads='uploads' in features,
+                        check_live=(plan[channel_id] == 'full' and 'live' in features),
+                        scraping=scraping
+                    ),
+                    timeout=SOCIAL_POLL_TIMEOUT
+                )
 
-                    tracker['last_live_video_id'] = live_video_id
-                    tracker['last_live_notify_time'] = now_ts
-                    tracker['stream_start_time'] = stream_start  # Track stream start time
-                    
+        found = [channel_id for channel_id in channel_ids if channel_id in youtube_channels]
+        results = await asyncio.gather(*(sweep_channel(channel_id) for channel_id in found), return_exceptions=True)
+
+        # One failing or slow channel never takes the rest of the sweep down with it. Channels
+        # the scraper couldn't read are left out like other failures, they aren't missing.
+        unreadable = getattr(youtube_channels, 'failed', set())
+        snapshots = {
+            channel_id: None for channel_id in channel_ids
+            if channel_id not in youtube_channels and channel_id not in unreadable
+        }
+        for channel_id, result in zip(found, results):
+            if isinstance(result, asyncio.TimeoutError):
+                print(f"[YouTube] Polling {channel_id} timed out after {SOCIAL_POLL_TIMEOUT}s")
+            elif isinstance(result, QuotaExceeded):
+                continue  # Reported once below, the channel stays queued
+            elif isinstance(result, Exception):
+                print(f"[YouTube] Error polling {channel_id}: {result}")
             else:
-                # If was live but now ended
-                if tracker.get('last_live_video_id'):
-                    tracker['last_live_video_id'] = None
-                    channel = bot.get_channel(int(tracker['post_channel']))
-                    if channel:
-                        await channel.send(
-                            embed=discord.Embed(
-                                title=f"📺 Stream Ended - {tracker['account_name']}",
-                                description="The live stream has ended.",
-                                color=discord.Color.blue(),
-                                timestamp=datetime.utcnow()
-                            )
-                        )
+                result['channel_info'] = youtube_channels[channel_id]
+                snapshots[channel_id] = result
+
+        # Live status stage: every candidate stream across the batch (fresh search
+        # hits plus streams trackers still consider live) in one videos.list per 50 IDs
+        polled = {channel_id: snapshot for channel_id, snapshot in snapshots.items() if snapshot}
+        candidate_ids = [
+            video_id for channel_id, snapshot in polled.items()
+            for video_id in [snapshot['live_video_id']] + [tracker.get('last_live_video_id') for _, tracker in subscriptions[channel_id]]
+            if video_id
+        ]
+        try:
+            live_details = await source.fetch_videos(
+                candidate_ids,
+                part="snippet,liveStreamingDetails",
+                fields=LIVE_DETAILS_FIELDS
+            )
+        except Exception as e:
+            print(f"[YouTube] Error fetching live stream details: {e}")
+            live_details = None
+        if live_details:
+            prune_stream_sessions(live_details)
+            record_stream_samples(live_details)
+        if youtube_client and youtube_client.breaker.state == 'open' and not scraping:
+            print(f"⛔ [YouTube] API quota exhausted, polling paused until "
+                  f"{youtube_client.breaker.reopen_at:%Y-%m-%d %H:%M} UTC")
+
+        unreadable = getattr(live_details, 'failed', set())
+        for channel_id, snapshot in polled.items():
+            # A stream whose page couldn't be read may well still be live, so its
+            # channel waits for the next poll instead of finalizing it
+            if unreadable.intersection(
+                [snapshot['live_video_id']] + [tracker.get('last_live_video_id') for _, tracker in subscriptions[channel_id]]
+            ):
+                print(f"[YouTube] Couldn't read the live status of {channel_id}, retrying next poll")
+                del snapshots[channel_id]
+                continue
+            snapshot['live_details'] = live_details
+        return snapshots
+
+    async def apply(self, guild_id: str, tracker, snapshot: dict):
+        await check_youtube_update(guild_id, tracker, snapshot['channel_info'], snapshot)
+
+    def reschedule(self, channel_id: str, subscribers, snapshot: dict = None, delay: float = None):
+        if snapshot is not None:
+            requeue_channel(channel_id, adapt_poll_interval(channel_id, subscribers, snapshot))
+            channel_poll_times[channel_id] = datetime.utcnow().timestamp()
+            return
+        # Channels that failed keep their current interval, and work cut off by the
+        # quota circuit breaker stays due so it runs as soon as the breaker closes
+        if delay is None and youtube_client and youtube_client.breaker.state == 'open':
+            delay = 0
+        requeue_channel(channel_id, delay)
 
-        # Save updates
-        tracker['last_update_time'] = datetime.utcnow().timestamp()
-        save_social_trackers()
+    def sweep_stats(self) -> dict:
+        return {
+            'source': 'scraper' if youtube_source() is youtube_scraper else 'api',
+            **(youtube_client.cache_stats() if youtube_client else {})
+        }
 
-    except HttpError as e:
-        if e.resp.status == 403:
-            print(f"[YouTube] API quota exceeded for {tracker['account_name']}")
-        else:
-            print(f"[YouTube] API error: {e}")
-    except Exception as e:
-        print(f"[YouTube] Error checking {tracker['account_name']}: {e}")
+def register_provider(provider: PlatformProvider):
+    social_providers[provider.name] = provider
+
+register_provider(YouTubeProvider())
 
 # Load configs on startup
 load_config()
 load_social_trackers()
+load_tracker_state()
+stats_store.load()
 load_event_schedule()
 
 # UI Components
@@ -1503,15 +2474,17 @@ async def on_member_join(member: discord.Member):
 @app_commands.describe(
     platform="Select platform to track",
     account_url="Full URL to the account",
-    post_channel="Channel to post updates"
+    post_channel="Channel to post updates",
+    priority="Polling priority (0-10): when quota runs short, higher priority trackers keep full polls longest"
 )
 @app_commands.choices(platform=[
-    app_commands.Choice(name="YouTube", value="youtube")
+    app_commands.Choice(name=provider.label, value=provider.name) for provider in social_providers.values()
 ])
 async def add_social_tracker(interaction: discord.Interaction, 
                             platform: str, 
                             account_url: str,
-                            post_channel: discord.TextChannel):
+                            post_channel: discord.TextChannel,
+                            priority: app_commands.Range[int, 0, 10] = 0):
     if not interaction.user.guild_permissions.manage_guild:
         return await interaction.response.send_message(
             embed=create_embed(
@@ -1530,7 +2503,9 @@ async def add_social_tracker(interaction: discord.Interaction,
     account_info = {}
     try:
         if platform == "youtube":
-            if not YOUTUBE_API_KEY:
+            # Without quota left (or a key at all) the public pages are scraped instead
+            source = youtube_source() or youtube_client
+            if not source:
                 return await interaction.response.send_message(
                     embed=create_embed(
                         title="❌ YouTube Disabled",
@@ -1539,90 +2514,92 @@ async def add_social_tracker(interaction: discord.Interaction,
                     ),
                     ephemeral=True
                 )
+            scraping = source is youtube_scraper
             
-            channel_id = None
-        
-            if "youtube.com/channel/" in account_url:
-                channel_id = account_url.split("youtube.com/channel/")[1].split("/")[0].split("?")[0]
-            elif "youtube.com/@" in account_url:
-                handle = account_url.split("youtube.com/@")[1].split("/")[0].split("?")[0]
-                
-                request = youtube_service.channels().list(
-                    part="id,snippet",
-                    forUsername=handle
-                )
-                response = request.execute()
-                
-                if not response.get('items'):
-                    return await interaction.response.send_message(
-                        embed=create_embed(
-                            title="❌ Channel Not Found",
-                            description="Couldn't find YouTube channel with that handle",
-                            color=discord.Color.red()
-                        ),
-                        ephemeral=True
-                    )
-                    
-                channel_id = response['items'][0]['id']
-            else:
-                return await interaction.response.send_message(
+            await interaction.response.defer(ephemeral=True)
+            
+            try:
+                channel_id = await (youtube_scraper if scraping else channel_resolver).resolve(account_url)
+            except ValueError:
+                return await interaction.followup.send(
                     embed=create_embed(
                         title="❌ Invalid URL",
-                        description="Please provide a valid YouTube channel URL",
+                        description="Please provide a valid YouTube channel URL (`/@handle`, `/channel/`, `/c/` or `/user/`)",
                         color=discord.Color.red()
                     ),
                     ephemeral=True
                 )
-        
-            search_req = youtube_service.search().list(
-                part="id",
-                channelId=channel_id,
-                order="date",
-                maxResults=1,
-                type="video"
-            )
-            search_res = search_req.execute()
-            latest_video_id = search_res['items'][0]['id']['videoId'] if search_res.get('items') else None
-        
-            search_live = youtube_service.search().list(
-                part="id",
-                channelId=channel_id,
-                eventType="live",
-                type="video",
-                maxResults=1
-            ).execute()
-            latest_live_id = search_live['items'][0]['id']['videoId'] if search_live.get('items') else None
-        
-            request = youtube_service.channels().list(
-                part='statistics,snippet',
-                id=channel_id
+            
+            channels = await source.fetch_channels(
+                [channel_id] if channel_id else [],
+                part='statistics,snippet,contentDetails'
             )
-            response = request.execute()
+            channel_info = channels.get(channel_id)
             
-            if not response.get('items'):
-                return await interaction.response.send_message(
+            if channel_id in getattr(channels, 'failed', ()):
+                return await interaction.followup.send(
+                    embed=create_embed(
+                        title="❌ YouTube Unavailable",
+                        description="Couldn't read that channel's page right now, please try again later",
+                        color=discord.Color.red()
+                    ),
+                    ephemeral=True
+                )
+            if not channel_info:
+                return await interaction.followup.send(
                     embed=create_embed(
                         title="❌ Channel Not Found",
-                        description="Couldn't find YouTube channel",
+                        description="Couldn't find a YouTube channel at that URL",
                         color=discord.Color.red()
                     ),
                     ephemeral=True
                 )
             
-            stats = response['items'][0]['statistics']
+            # The newest upload is the first item of the uploads playlist, 1 unit instead of a 100 unit search
+            latest_video_id = None
+            if scraping:
+                uploads = await youtube_scraper.fetch_uploads(channel_id)
+                latest_video_id = uploads[0]['video_id'] if uploads else None
+            else:
+                try:
+                    playlist = await youtube_client.call(
+                        'playlistItems', 'list',
+                        part="contentDetails",
+                        playlistId=uploads_playlist_id(channel_id, channel_info),
+                        maxResults=1,
+                        fields="items/contentDetails/videoId"
+                    )
+                    if playlist.get('items'):
+                        latest_video_id = playlist['items'][0]['contentDetails']['videoId']
+                except HttpError as e:
+                    if e.resp.status != 404:  # Channels without uploads have no playlist
+                        raise
+            
+            record_channel_stats({channel_id: channel_info})
+            sub_count_raw = channel_info['statistics'].get('subscriberCount')
             account_info = {
                 'platform': platform,
                 'url': account_url,
                 'channel_id': channel_id,
-                'account_name': response['items'][0]['snippet']['title'],
-                'last_count': int(stats['subscriberCount']),
+                'account_name': channel_info['snippet']['title'],
+                'last_count': int(sub_count_raw) if sub_count_raw and sub_count_raw.isdigit() else 0,
                 'last_video_id': latest_video_id,
-                'last_live_video_id': latest_live_id,
-                'post_channel': str(post_channel.id)
+                'last_live_video_id': None,
+                'post_channel': str(post_channel.id),
+                'priority': priority
             }
 
+    except QuotaExceeded as e:
+        return await interaction.followup.send(
+            embed=create_embed(
+                title="❌ YouTube Quota Exhausted",
+                description=f"{e}. Please try again after the daily reset.",
+                color=discord.Color.red()
+            ),
+            ephemeral=True
+        )
     except HttpError as e:
-        return await interaction.response.send_message(
+        return await interaction.followup.send(
             embed=create_embed(
                 title="❌ YouTube API Error",
                 description=f"YouTube API error: {str(e)}",
@@ -1631,7 +2608,7 @@ async def add_social_tracker(interaction: discord.Interaction,
             ephemeral=True
         )
     except Exception as e:
-        return await interaction.response.send_message(
+        return await interaction.followup.send(
             embed=create_embed(
                 title="❌ Setup Failed",
                 description=f"Error: {str(e)}",
@@ -1643,7 +2620,7 @@ async def add_social_tracker(interaction: discord.Interaction,
     social_trackers[guild_id].append(account_info)
     save_social_trackers()
     
-    await interaction.response.send_message(
+    await interaction.followup.send(
         embed=create_embed(
             title="✅ Tracker Added",
             description=(
@@ -1655,6 +2632,199 @@ async def add_social_tracker(interaction: discord.Interaction,
         ephemeral=True
     )
 
+BULK_IMPORT_MAX_ROWS = 500
+
+def parse_import_rows(text: str, guild: discord.Guild, default_channel: Optional[discord.TextChannel]) -> list:
+    """Parse ``url[, channel[, priority]]`` lines into row dicts, the channel as a mention, ID or name"""
+    rows = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = [part.strip() for part in line.replace('\t', ',').split(',')]
+        url, target = parts[0], parts[1] if len(parts) > 1 and parts[1] else None
+
+        post_channel = default_channel
+        if target:
+            target_id = target.strip('<#>')
+            if target_id.isdigit():
+                post_channel = guild.get_channel(int(target_id))
+            else:
+                post_channel = discord.utils.get(guild.text_channels, name=target.lstrip('#'))
+        priority = parts[2] if len(parts) > 2 else ''
+        rows.append({
+            'line': line_no,
+            'url': url,
+            'post_channel': post_channel,
+            'priority': min(int(priority), 10) if priority.isdigit() else 0,
+            'status': None,
+            'detail': ''
+        })
+    return rows
+
+@bot.tree.command(name="import-social-trackers", description="Add many YouTube trackers from a file")
+@app_commands.describe(
+    file="Text/CSV file with one `channel URL, post channel, priority` per line (the last two optional)",
+    default_channel="Channel for rows that don't name one"
+)
+async def import_social_trackers(interaction: discord.Interaction,
+                                 file: discord.Attachment,
+                                 default_channel: Optional[discord.TextChannel] = None):
+    if not interaction.user.guild_permissions.manage_guild:
+        return await interaction.response.send_message(
+            embed=create_embed(
+                title="❌ Permission Denied",
+                description="You need 'Manage Server' permission to set up trackers",
+                color=discord.Color.red()
+            ),
+            ephemeral=True
+        )
+    
+    if not YOUTUBE_API_KEY:
+        return await interaction.response.send_message(
+            embed=create_embed(
+                title="❌ YouTube Disabled",
+                description="YouTube API key not configured",
+                color=discord.Color.red()
+            ),
+            ephemeral=True
+        )
+    
+    await interaction.response.defer(ephemeral=True)
+    
+    try:
+        text = (await file.read()).decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return await interaction.followup.send(
+            embed=create_embed(
+                title="❌ Invalid File",
+                description="The attachment must be a UTF-8 text or CSV file",
+                color=discord.Color.red()
+            ),
+            ephemeral=True
+        )
+    
+    rows = parse_import_rows(text, interaction.guild, default_channel)
+    if not rows or len(rows) > BULK_IMPORT_MAX_ROWS:
+        return await interaction.followup.send(
+            embed=create_embed(
+                title="❌ Invalid File",
+                description=f"The file must list between 1 and {BULK_IMPORT_MAX_ROWS} channels",
+                color=discord.Color.red()
+            ),
+            ephemeral=True
+        )
+    
+    for row in rows:
+        if not parse_channel_url(row['url']):
+            row['status'], row['detail'] = "❌", "Not a YouTube channel URL"
+        elif not row['post_channel']:
+            row['status'], row['detail'] = "❌", "Post channel not found"
+    pending = [row for row in rows if not row['status']]
+    
+    guild_id = str(interaction.guild.id)
+    trackers = social_trackers.setdefault(guild_id, [])
+    existing = {(tracker['channel_id'], tracker['post_channel']) for tracker in trackers}
+    added = []
+    
+    try:
+        resolved = await channel_resolver.resolve_many([row['url'] for row in pending])
+        channels = await youtube_client.fetch_channels(
+            [channel_id for channel_id in resolved.values() if channel_id],
+            part='statistics,snippet,contentDetails'
+        )
+        record_channel_stats(channels)
+        
+        new_rows = []
+        for row in pending:
+            channel_id = resolved.get(row['url'])
+            key = (channel_id, str(row['post_channel'].id))
+            if channel_id not in channels:
+                row['status'], row['detail'] = "❌", "Channel not found"
+            elif key in existing:
+                row['status'], row['detail'] = "➖", "Already tracked"
+            else:
+                existing.add(key)
+                row['channel_id'] = channel_id
+                new_rows.append(row)
+        
+        # Newest upload per channel from the uploads playlist, 1 unit each
+        for batch in chunked(new_rows, MAX_IDS_PER_REQUEST):
+            latest = await asyncio.gather(*(
+                youtube_client.call(
+                    'playlistItems', 'list',
+                    part="contentDetails",
+                    playlistId=uploads_playlist_id(row['channel_id'], channels[row['channel_id']]),
+                    maxResults=1,
+                    fields="items/contentDetails/videoId"
+                )
+                for row in batch
+            ), return_exceptions=True)
+            
+            for row, playlist in zip(batch, latest):
+                if isinstance(playlist, QuotaExceeded):
+                    raise playlist
+                channel_info = channels[row['channel_id']]
+                items = playlist.get('items') if isinstance(playlist, dict) else None
+                sub_count_raw = channel_info['statistics'].get('subscriberCount')
+                tracker = {
+                    'platform': 'youtube',
+                    'url': row['url'],
+                    'channel_id': row['channel_id'],
+                    'account_name': channel_info['snippet']['title'],
+                    'last_count': int(sub_count_raw) if sub_count_raw and sub_count_raw.isdigit() else 0,
+                    'last_video_id': items[0]['contentDetails']['videoId'] if items else None,
+                    'last_live_video_id': None,
+                    'post_channel': str(row['post_channel'].id),
+                    'priority': row['priority']
+                }
+                added.append(tracker)
+                row['status'], row['detail'] = "✅", tracker['account_name']
+    except (QuotaExceeded, HttpError) as e:
+        reason = "Quota exhausted" if isinstance(e, QuotaExceeded) else f"YouTube API error {e.resp.status}"
+        for row in pending:
+            if not row['status']:
+                row['status'], row['detail'] = "⏸️", f"{reason}, not imported"
+    except Exception as e:
+        # Timeouts and connection errors: keep what was collected and report the rest as failed
+        print(f"[YouTube] Error importing trackers for guild {guild_id}: {e}")
+        for row in pending:
+            if not row['status']:
+                row['status'], row['detail'] = "❌", f"Error: {type(e).__name__}, not imported"
+    
+    if added:
+        trackers.extend(added)
+        save_social_trackers()
+    elif not trackers:
+        del social_trackers[guild_id]
+    
+    table = "\n".join(
+        f"{row['line']:>4} {row['status']} {row['url'][:40]:<40} "
+        + (f"→ #{row['post_channel'].name} " if row['post_channel'] else "")
+        + row['detail']
+        for row in rows
+    )
+    summary = f"Added **{len(added)}** of {len(rows)} channels"
+    if len(table) <= 3900:
+        await interaction.followup.send(
+            embed=create_embed(
+                title="📥 Tracker Import",
+                description=f"{summary}\n```\n{table}\n```",
+                color=discord.Color.green() if added else discord.Color.orange()
+            ),
+            ephemeral=True
+        )
+    else:
+        await interaction.followup.send(
+            embed=create_embed(
+                title="📥 Tracker Import",
+                description=f"{summary}, see the attached results",
+                color=discord.Color.green() if added else discord.Color.orange()
+            ),
+            file=discord.File(io.BytesIO(table.encode()), filename="import_results.txt"),
+            ephemeral=True
+        )
+
 @bot.tree.command(name="list-social-trackers", description="Show active social media trackers")
 async def list_social_trackers(interaction: discord.Interaction):
     if not interaction.user.guild_permissions.manage_guild:
@@ -1706,12 +2876,24 @@ async def list_social_trackers(interaction: discord.Interaction):
             if 'last_update_time' in tracker:
                 last_update = f"\n**Last Update:** <t:{int(tracker['last_update_time'])}:R>"
             
+            health = tracker.get('health', {})
+            if health.get('quarantined'):
+                health_display = f"🔴 Quarantined (`{health['last_error']}`), next probe <t:{int(health['next_probe'])}:R>"
+            elif health.get('failures'):
+                health_display = f"🟡 {health['failures']} failure(s) (`{health['last_error']}`)"
+            else:
+                health_display = "🟢 OK"
+            if health.get('wasted_calls'):
+                health_display += f", {health['wasted_calls']:g} API calls wasted"
+            
             embed.add_field(
                 name=f"{i}. {tracker['account_name']}",
                 value=(
                     f"**Platform:** {tracker['platform'].capitalize()}\n"
                     f"**Channel:** {channel_display}\n"
-                    f"**Current Count:** {count}"
+                    f"**Current Count:** {count}\n"
+                    + (f"**Priority:** {tracker['priority']}\n" if tracker.get('priority') else "")
+                    + f"**Health:** {health_display}"
                     f"{last_update}\n"
                     f"[View Profile]({tracker['url']})"
                 ),
@@ -1721,6 +2903,55 @@ async def list_social_trackers(interaction: discord.Interaction):
             print(f"Error processing tracker {i}: {e}")
             continue
     
+    if youtube_client:
+        quota = youtube_client.quota
+        exhaustion = quota.projected_exhaustion()
+        cache = youtube_client.cache_stats()
+        breaker = youtube_client.breaker
+        if breaker.state == 'closed':
+            breaker_status = "🟢 Closed"
+        elif breaker.is_open:
+            breaker_status = f"🔴 Open since <t:{int(breaker.opened_at.timestamp())}:R>, probing <t:{int(breaker.reopen_at.timestamp())}:R>"
+        else:
+            breaker_status = "🟡 Probing on next call"
+        embed.add_field(
+            name="📉 YouTube API Quota",
+            value=(
+                f"**Remaining:** {quota.remaining:,}/{quota.daily_limit:,} units\n"
+                f"**Resets:** <t:{int(quota.reset_at.timestamp())}:R>\n"
+                f"**Projected Exhaustion:** "
+                + (f"<t:{int(exhaustion.timestamp())}:t>" if exhaustion else "Not before reset")
+                + f"\n**Cache:** {cache['metadata_hit_rate']:.0%} metadata hits, "
+                f"{cache['etag_hit_rate']:.0%} ETag hits, {cache['bytes_saved'] / 1024:,.0f} KB saved\n"
+                f"**Circuit Breaker:** {breaker_status}"
+            ),
+            inline=False
+        )
+    
+    sweep_lines = []
+    for platform, stats in social_poll_stats.items():
+        label = social_providers[platform].label if platform in social_providers else platform
+        line = f"**{label}:** {stats.get('channels_polled', 0):,} polled, {stats.get('deferred', 0):,} deferred"
+        if 'sweep_seconds' in stats:
+            overrun = " ⚠️" if stats['sweep_seconds'] > SOCIAL_POLL_INTERVAL else ""
+            line += (
+                f" in {stats['sweep_seconds']:.1f}s of the {SOCIAL_POLL_INTERVAL}s interval{overrun}\n"
+                f"{stats['api_calls']:,} API calls, {stats['api_calls_saved']:,} saved by account dedupe"
+            )
+        sweep_lines.append(line)
+    if sweep_lines:
+        embed.add_field(name="⏱️ Last Sweep", value="\n".join(sweep_lines), inline=False)
+    
+    if youtube_scraper and youtube_source() is youtube_scraper:
+        embed.add_field(
+            name="🕸️ Key-less Mode",
+            value=(
+                f"Reading public YouTube pages, subscriber counts are approximate\n"
+                f"**Requests:** {youtube_scraper.stats['requests']:,} ({youtube_scraper.stats['errors']:,} failed)"
+            ),
+            inline=False
+        )
+    
     embed.set_footer(text="Nexus Esports YT Updates")
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -1756,6 +2987,9 @@ async def remove_social_tracker(interaction: discord.Interaction, index: int):
     else:
         del social_trackers[guild_id]
     save_social_trackers()
+    if not any(tracker['channel_id'] == removed['channel_id'] for trackers in social_trackers.values() for tracker in trackers):
+        stats_store.forget([removed['channel_id']])
+        stats_store.save()
     
     await interaction.response.send_message(
         embed=create_embed(
@@ -2074,7 +3308,22 @@ async def main():
     flask_thread = Thread(target=run_flask)
     flask_thread.daemon = True
     flask_thread.start()
-    await bot.start(token)
+    # Hosts stop the bot with SIGTERM: close it cleanly so the state below gets saved
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, lambda: asyncio.create_task(bot.close()))
+    except NotImplementedError:
+        pass  # Windows event loops have no signal handlers
+    try:
+        await bot.start(token)
+    finally:
+        save_tracker_state()
+        stats_store.save()
+        if youtube_client:
+            youtube_client.shutdown()
+        if youtube_feed_poller:
+            youtube_feed_poller.shutdown()
+        if youtube_scraper:
+            youtube_scraper.shutdown()
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,129 @@
+import asyncio
+
+MAX_EMBEDS = 10  # Discord's per-message limits
+MAX_FILES = 10
+MAX_EMBED_CHARS = 6000  # Summed over every embed in the message
+
+
+def merge_content(contents) -> str:
+    """Combine the pings of coalesced notifications, each mention once.
+
+    @everyone already notifies everyone @here would, so it replaces it.
+    """
+    mentions = []
+    for content in contents:
+        for mention in (content or '').split():
+            if mention not in mentions:
+                mentions.append(mention)
+    if '@everyone' in mentions and '@here' in mentions:
+        mentions.remove('@here')
+    return " ".join(mentions) or None
+
+
+def merge_allowed_mentions(allowed):
+    allowed = [mentions for mentions in allowed if mentions is not None]
+    if not allowed:
+        return None
+    merged = allowed[0]
+    for mentions in allowed[1:]:
+        merged = merged.merge(mentions)
+    return merged
+
+
+class NotificationOutbox:
+    """Per-channel buffer that coalesces notifications into multi-embed messages.
+
+    Items queued for a channel are held for ``window`` seconds, then sent in as
+    few messages as Discord's embed, character and attachment limits allow, in
+    order. A window of 0 sends every item right away. ``deliver(channel_id, **kwargs)``
+    posts one message and returns it.
+    """
+
+    def __init__(self, deliver, window: float = 2.0):
+        self.deliver = deliver
+        self.window = window
+        self._pending = {}  # channel_id -> [item], oldest first
+        self._timers = {}   # channel_id -> flush task
+        self.stats = {'notifications': 0, 'messages': 0}
+
+    async def add(self, channel_id: str, embeds: list, content: str = None, files: list = None,
+                  allowed_mentions=None, username: str = None, avatar_url: str = None, on_sent=None):
+        """Queue a notification. ``on_sent(message, embed_index, shared)`` is called once it's posted."""
+        self._pending.setdefault(channel_id, []).append({
+            'embeds': embeds,
+            'content': content,
+            'files': files or [],
+            'allowed_mentions': allowed_mentions,
+            'username': username,
+            'avatar_url': avatar_url,
+            'on_sent': on_sent
+        })
+        self.stats['notifications'] += 1
+        if self.window <= 0:
+            await self.flush(channel_id)
+        elif channel_id not in self._timers:
+            self._timers[channel_id] = asyncio.create_task(self._flush_later(channel_id))
+
+    async def _flush_later(self, channel_id: str):
+        await asyncio.sleep(self.window)
+        self._timers.pop(channel_id, None)
+        await self.flush(channel_id)
+
+    def _batches(self, items: list) -> list:
+        batches = []
+        for item in items:
+            batch = batches[-1] if batches else None
+            if batch:
+                names = {file.filename for queued in batch for file in queued['files']}
+                fits = (
+                    sum(len(queued['embeds']) for queued in batch) + len(item['embeds']) <= MAX_EMBEDS
+                    and sum(len(embed) for queued in batch + [item] for embed in queued['embeds']) <= MAX_EMBED_CHARS
+                    and len(names) + len(item['files']) <= MAX_FILES
+                    and not names & {file.filename for file in item['files']}
+                )
+                if fits:
+                    batch.append(item)
+                    continue
+            batches.append([item])
+        return batches
+
+    async def flush(self, channel_id: str):
+        """Send everything queued for a channel now"""
+        timer = self._timers.pop(channel_id, None)
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+        items = self._pending.pop(channel_id, [])
+        for batch in self._batches(items):
+            # Webhook deliveries keep the account's name and avatar when the batch has only one
+            identities = {(item['username'], item['avatar_url']) for item in batch}
+            username, avatar_url = identities.pop() if len(identities) == 1 else (None, None)
+            try:
+                message = await self.deliver(
+                    channel_id,
+                    content=merge_content(item['content'] for item in batch),
+                    embeds=[embed for item in batch for embed in item['embeds']],
+                    files=[file for item in batch for file in item['files']],
+                    allowed_mentions=merge_allowed_mentions(item['allowed_mentions'] for item in batch),
+                    username=username,
+                    avatar_url=avatar_url
+                )
+            except Exception as e:
+                print(f"⚠️ Error sending notifications to {channel_id}: {e}")
+                continue
+            if not message:
+                continue
+            self.stats['messages'] += 1
+
+            shared = len(batch) > 1
+            embed_index = 0
+            for item in batch:
+                if item['on_sent']:
+                    try:
+                        item['on_sent'](message, embed_index, shared)
+                    except Exception as e:
+                        print(f"⚠️ Error handling sent notification: {e}")
+                embed_index += len(item['embeds'])
+
+    async def flush_all(self):
+        for channel_id in list(self._pending):
+            await self.flush(channel_id)
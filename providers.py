@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+
+
+class PlatformProvider(ABC):
+    """A platform social trackers can follow.
+
+    The sweep groups trackers by provider and account ID, asks the provider
+    which accounts are due and affordable, then hands them to ``fetch_many`` in
+    batches of ``max_batch``. A provider therefore pays per batch rather than
+    per tracker, and each account's snapshot fans out to every tracker of it.
+    """
+
+    name = None        # The trackers' ``platform`` value
+    label = None       # Shown in commands
+    max_batch = 50     # Accounts per fetch_many call
+
+    def available(self) -> bool:
+        """Whether the provider can poll at all right now"""
+        return True
+
+    def wants(self, tracker) -> bool:
+        """Whether this tracker needs polling, e.g. not with every notification switched off"""
+        return True
+
+    def cost(self, account_id: str, full: bool, subscribers) -> float:
+        """Estimated provider quota units for one poll of an account, light or full.
+
+        ``subscribers`` are the account's ``(guild_id, tracker)`` pairs, whose
+        notification settings decide what a poll has to fetch. ``plan`` uses this
+        to fit the due accounts into the provider's quota.
+        """
+        return 0
+
+    def due(self, subscriptions: dict) -> list:
+        """Account IDs that should be polled this cycle"""
+        return list(subscriptions)
+
+    def plan(self, due: dict) -> dict:
+        """Map the affordable due accounts to "light" or "full" polls"""
+        return {account_id: 'full' for account_id in due}
+
+    @abstractmethod
+    async def fetch_many(self, account_ids: list, plan: dict, subscriptions: dict) -> dict:
+        """Poll a batch of accounts, returning ``{account_id: snapshot}``.
+
+        Accounts that don't exist (anymore) map to None. Accounts that failed
+        are left out of the result, reported by the provider, and stay queued.
+        """
+
+    @abstractmethod
+    async def apply(self, guild_id: str, tracker, snapshot: dict):
+        """Send one tracker's notifications for its account's snapshot"""
+
+    def api_calls_made(self) -> int:
+        """Running count of API calls, for per-sweep accounting"""
+        return 0
+
+    def reschedule(self, account_id: str, subscribers, snapshot: dict = None, delay: float = None):
+        """Schedule an account's next poll after a sweep, snapshot is None if it wasn't polled"""
+
+    def sweep_stats(self) -> dict:
+        """Counters to merge into the sweep's stats"""
+        return {}
@@ -0,0 +1,111 @@
+import io
+from PIL import Image, ImageDraw, ImageFont
+
+STREAM_MAX_SAMPLES = 240  # Samples kept per session, older ones are merged pairwise beyond this
+
+
+class StreamSession:
+    """Viewer counts sampled over one live stream, in a bounded, downsampled series.
+
+    Peak and the time-weighted average are tracked exactly as samples arrive,
+    so downsampling only costs the chart resolution.
+    """
+
+    def __init__(self, video_id: str, started_at: float = None, max_samples: int = STREAM_MAX_SAMPLES):
+        self.video_id = video_id
+        self.started_at = started_at
+        self.max_samples = max_samples
+        self.samples = []  # [(timestamp, viewers)], oldest first
+        self.peak = 0
+        self.peak_at = None
+        self.viewer_seconds = 0.0
+        self.covered_seconds = 0.0
+        self.last_sample = None
+        self.chart_png = None  # Rendered once at stream end, shared by every tracker
+
+    def add(self, timestamp: float, viewers: int):
+        if self.last_sample:
+            last_timestamp, last_viewers = self.last_sample
+            if timestamp <= last_timestamp:
+                return
+            self.viewer_seconds += last_viewers * (timestamp - last_timestamp)
+            self.covered_seconds += timestamp - last_timestamp
+        self.last_sample = (timestamp, viewers)
+        if viewers >= self.peak:
+            self.peak, self.peak_at = viewers, timestamp
+
+        self.samples.append((timestamp, viewers))
+        if len(self.samples) > self.max_samples:
+            # Halve the resolution, each pair becomes its first timestamp and mean viewers
+            merged = [
+                (self.samples[i][0], (self.samples[i][1] + self.samples[i + 1][1]) // 2)
+                for i in range(0, len(self.samples) - 1, 2)
+            ]
+            if len(self.samples) % 2:
+                merged.append(self.samples[-1])
+            self.samples = merged
+
+    @property
+    def average(self) -> int:
+        if self.covered_seconds:
+            return round(self.viewer_seconds / self.covered_seconds)
+        return self.last_sample[1] if self.last_sample else 0
+
+    def to_dict(self) -> dict:
+        return {
+            'video_id': self.video_id,
+            'started_at': self.started_at,
+            'samples': self.samples,
+            'peak': self.peak,
+            'peak_at': self.peak_at,
+            'viewer_seconds': self.viewer_seconds,
+            'covered_seconds': self.covered_seconds,
+            'last_sample': self.last_sample
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StreamSession':
+        session = cls(data['video_id'], data.get('started_at'))
+        session.samples = [tuple(sample) for sample in data.get('samples', [])]
+        session.peak = data.get('peak', 0)
+        session.peak_at = data.get('peak_at')
+        session.viewer_seconds = data.get('viewer_seconds', 0.0)
+        session.covered_seconds = data.get('covered_seconds', 0.0)
+        session.last_sample = tuple(data['last_sample']) if data.get('last_sample') else None
+        return session
+
+
+def render_viewer_chart(samples: list, width: int = 600, height: int = 220) -> bytes:
+    """Draw viewers over time as a filled line chart and return PNG bytes.
+
+    Blocking, meant to run in an executor rather than on the event loop.
+    """
+    image = Image.new('RGB', (width, height), (32, 34, 37))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+    left, top, right, bottom = 50, 15, width - 15, height - 25
+
+    draw.line([(left, bottom), (right, bottom)], fill=(90, 90, 90))
+    draw.line([(left, top), (left, bottom)], fill=(90, 90, 90))
+    if len(samples) < 2:
+        draw.text((left + 10, top + 10), "Not enough samples", fill=(200, 200, 200), font=font)
+    else:
+        start, end = samples[0][0], samples[-1][0]
+        peak = max(viewers for _, viewers in samples) or 1
+        points = [
+            (left + (timestamp - start) / (end - start) * (right - left), bottom - viewers / peak * (bottom - top))
+            for timestamp, viewers in samples
+        ]
+        draw.polygon([(left, bottom)] + points + [(right, bottom)], fill=(120, 30, 30))
+        draw.line(points, fill=(255, 70, 70), width=2)
+
+        draw.text((5, top), f"{peak:,}", fill=(200, 200, 200), font=font)
+        draw.text((5, bottom - 10), "0", fill=(200, 200, 200), font=font)
+        minutes = int((end - start) // 60)
+        label = f"{minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"{minutes}m"
+        draw.text((left, bottom + 6), "Start", fill=(200, 200, 200), font=font)
+        draw.text((right - 40, bottom + 6), label, fill=(200, 200, 200), font=font)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
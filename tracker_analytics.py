@@ -0,0 +1,81 @@
+import time
+import warnings
+import numpy as np
+from tracker_stats import TimeSeriesStore
+
+DAY = 86400
+HISTORY_DAYS = 30
+# Subscriber milestones for trackers without their own milestone_thresholds
+DEFAULT_MILESTONES = (100, 1000, 10000, 100000, 1000000)
+
+
+def daily_matrix(store: TimeSeriesStore, channel_ids: list, days: int = HISTORY_DAYS, now: float = None) -> np.ndarray:
+    """Subscriber count at the end of each of the last ``days + 1`` UTC days, one row per channel.
+
+    Samples are bucketed by calendar day rather than by ``now - k days``, so a
+    daily run that drifts a few seconds still lands one sample per column.
+    Days without a sample before them are NaN, so new channels simply have shorter histories.
+    """
+    today = int(now or time.time()) // DAY
+    # Exclusive end of each day: the last sample before midnight represents it
+    day_ends = (today + 1 - np.arange(days, -1, -1, dtype=np.int64)) * DAY
+    matrix = np.full((len(channel_ids), days + 1), np.nan)
+    for row, channel_id in enumerate(channel_ids):
+        series = store.series.get(channel_id)
+        if not series or not len(series):
+            continue
+        timestamps = np.frombuffer(series.timestamps, dtype=np.int64)
+        subscribers = np.frombuffer(series.columns['subscribers'], dtype=np.int64)
+        last = np.searchsorted(timestamps, day_ends, side='left') - 1
+        valid = last >= 0
+        matrix[row, valid] = subscribers[last[valid]]
+    return matrix
+
+
+def analyze(store: TimeSeriesStore, channel_ids: list, now: float = None, milestones=DEFAULT_MILESTONES) -> dict:
+    """Growth metrics for every channel at once, keyed by channel ID.
+
+    Each entry has current, change_24h, growth_7d (percent), avg_7d and avg_30d
+    (subscribers per day), next_milestone and milestone_eta (a timestamp, or None
+    when the channel isn't growing).
+    """
+    if not channel_ids:
+        return {}
+    now = now or time.time()
+    milestones = np.array(sorted(milestones), dtype=np.float64)
+    matrix = daily_matrix(store, channel_ids, HISTORY_DAYS, now)
+    daily_change = np.diff(matrix, axis=1)
+    current = matrix[:, -1]
+
+    # Channels with too little history produce NaNs (and empty-slice warnings), not errors
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        change_24h = daily_change[:, -1]
+        avg_7d = np.nanmean(daily_change[:, -7:], axis=1)
+        avg_30d = np.nanmean(daily_change, axis=1)
+        week_ago = matrix[:, -8]
+        growth_7d = np.where(week_ago > 0, (current - week_ago) / week_ago * 100, np.nan)
+
+        next_index = np.searchsorted(milestones, current, side='right')
+        has_next = (next_index < len(milestones)) & ~np.isnan(current)
+        next_milestone = np.where(has_next, milestones[np.minimum(next_index, len(milestones) - 1)], np.nan)
+        days_to_milestone = np.where(avg_7d > 0, (next_milestone - current) / avg_7d, np.nan)
+
+    def value(array, i):
+        return None if np.isnan(array[i]) else float(array[i])
+
+    results = {}
+    for i, channel_id in enumerate(channel_ids):
+        if np.isnan(current[i]):
+            continue
+        days = value(days_to_milestone, i)
+        results[channel_id] = {
+            'current': int(current[i]),
+            'change_24h': None if np.isnan(change_24h[i]) else int(change_24h[i]),
+            'growth_7d': value(growth_7d, i),
+            'avg_7d': value(avg_7d, i),
+            'avg_30d': value(avg_30d, i),
+            'next_milestone': None if np.isnan(next_milestone[i]) else int(next_milestone[i]),
+            'milestone_eta': now + days * DAY if days is not None else None
+        }
+    return results
@@ -0,0 +1,190 @@
+import base64
+import json
+import os
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+
+COLUMNS = ('subscribers', 'views', 'videos')
+
+# (max age in seconds, bucket width in seconds): samples older than every tier's
+# age fall into the last tier, which keeps one sample per day forever
+RETENTION_TIERS = (
+    (7 * 86400, 0),          # Raw samples for a week
+    (90 * 86400, 3600),      # Hourly for three months
+    (None, 86400)            # Daily after that
+)
+COMPACT_EVERY = 256  # Appends per channel between downsampling passes
+
+
+def encode_column(values: array) -> str:
+    """Delta-encode an int64 column and deflate it, counts barely move between samples"""
+    deltas = array('q', values)
+    for i in range(len(deltas) - 1, 0, -1):
+        deltas[i] -= deltas[i - 1]
+    return base64.b64encode(zlib.compress(deltas.tobytes(), 9)).decode('ascii')
+
+
+def decode_column(data: str) -> array:
+    values = array('q')
+    values.frombytes(zlib.decompress(base64.b64decode(data)))
+    for i in range(1, len(values)):
+        values[i] += values[i - 1]
+    return values
+
+
+def bucket_width(age: float) -> int:
+    for max_age, width in RETENTION_TIERS:
+        if max_age is None or age <= max_age:
+            return width
+    return RETENTION_TIERS[-1][1]
+
+
+class ChannelSeries:
+    """Append-only, timestamp-ordered samples for one channel in parallel int64 columns"""
+
+    def __init__(self):
+        self.timestamps = array('q')
+        self.columns = {name: array('q') for name in COLUMNS}
+        self.appends = 0
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def append(self, timestamp: int, values: dict) -> bool:
+        if self.timestamps and timestamp <= self.timestamps[-1]:
+            return False  # Out of order or duplicate sample
+        self.timestamps.append(timestamp)
+        for name in COLUMNS:
+            # A hidden count is carried forward so columns stay aligned
+            value = values.get(name)
+            if value is None:
+                value = self.columns[name][-1] if self.columns[name] else 0
+            self.columns[name].append(value)
+        self.appends += 1
+        return True
+
+    def range(self, start: int = None, end: int = None) -> dict:
+        """Samples with start <= timestamp <= end, found by bisecting the timestamp column"""
+        lo = bisect_left(self.timestamps, start) if start is not None else 0
+        hi = bisect_right(self.timestamps, end) if end is not None else len(self.timestamps)
+        result = {'timestamps': self.timestamps[lo:hi]}
+        for name in COLUMNS:
+            result[name] = self.columns[name][lo:hi]
+        return result
+
+    def latest(self) -> dict:
+        if not self.timestamps:
+            return None
+        result = {'timestamp': self.timestamps[-1]}
+        for name in COLUMNS:
+            result[name] = self.columns[name][-1]
+        return result
+
+    def compact(self, now: float = None):
+        """Downsample old samples to their tier, keeping the last sample in each bucket"""
+        now = now or time.time()
+        keep = []
+        for i, timestamp in enumerate(self.timestamps):
+            width = bucket_width(now - timestamp)
+            if width and i + 1 < len(self.timestamps):
+                next_timestamp = self.timestamps[i + 1]
+                if bucket_width(now - next_timestamp) == width and next_timestamp // width == timestamp // width:
+                    continue  # A later sample represents this bucket
+            keep.append(i)
+        if len(keep) != len(self.timestamps):
+            self.timestamps = array('q', (self.timestamps[i] for i in keep))
+            for name in COLUMNS:
+                column = self.columns[name]
+                self.columns[name] = array('q', (column[i] for i in keep))
+        self.appends = 0
+
+    def to_dict(self) -> dict:
+        data = {'timestamps': encode_column(self.timestamps)}
+        for name in COLUMNS:
+            data[name] = encode_column(self.columns[name])
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ChannelSeries':
+        series = cls()
+        series.timestamps = decode_column(data['timestamps'])
+        for name in COLUMNS:
+            series.columns[name] = decode_column(data[name]) if name in data else array('q', [0] * len(series))
+        return series
+
+
+class TimeSeriesStore:
+    """Per-channel subscriber, view and video count history, persisted as one JSON file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.series = {}  # channel_id -> ChannelSeries
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.series = {channel_id: ChannelSeries.from_dict(columns) for channel_id, columns in data.items()}
+        except Exception as e:
+            print(f"⚠️ Error loading tracker stats: {e}")
+            self.series = {}
+
+    def save(self):
+        if not self.dirty:
+            return
+        with self._lock:
+            data = {channel_id: series.to_dict() for channel_id, series in self.series.items()}
+            self.dirty = False
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            print(f"⚠️ Error saving tracker stats: {e}")
+
+    def record(self, channel_id: str, statistics: dict, timestamp: float = None) -> bool:
+        """Append a channels.list ``statistics`` object, skipping counts the channel hides"""
+        values = {}
+        for name, key in (('subscribers', 'subscriberCount'), ('views', 'viewCount'), ('videos', 'videoCount')):
+            raw = statistics.get(key)
+            values[name] = int(raw) if raw and str(raw).isdigit() else None
+        if all(value is None for value in values.values()):
+            return False
+
+        with self._lock:
+            series = self.series.setdefault(channel_id, ChannelSeries())
+            appended = series.append(int(timestamp or time.time()), values)
+            if series.appends >= COMPACT_EVERY:
+                series.compact()
+            self.dirty = self.dirty or appended
+        return appended
+
+    def range(self, channel_id: str, start: float = None, end: float = None) -> dict:
+        series = self.series.get(channel_id)
+        if not series:
+            return None
+        with self._lock:
+            return series.range(int(start) if start is not None else None, int(end) if end is not None else None)
+
+    def latest(self, channel_id: str) -> dict:
+        series = self.series.get(channel_id)
+        return series.latest() if series else None
+
+    def compact(self):
+        with self._lock:
+            for series in self.series.values():
+                series.compact()
+            self.dirty = True
+
+    def forget(self, channel_ids):
+        """Drop history for channels no tracker follows anymore"""
+        with self._lock:
+            for channel_id in channel_ids:
+                if self.series.pop(channel_id, None) is not None:
+                    self.dirty = True
@@ -0,0 +1,535 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+# channels.list / videos.list accept at most 50 comma-separated IDs
+MAX_IDS_PER_REQUEST = 50
+
+
+# Data API quota cost per call type, anything not listed costs 1 unit
+QUOTA_COSTS = {
+    'search.list': 100,
+    'videos.insert': 1600,
+    'videos.update': 50,
+    'playlistItems.insert': 50
+}
+DEFAULT_DAILY_QUOTA = 10000
+PACIFIC = ZoneInfo('America/Los_Angeles')
+
+
+def call_cost(resource: str, method: str) -> int:
+    return QUOTA_COSTS.get(f"{resource}.{method}", 1)
+
+
+def next_quota_reset(now: datetime = None) -> datetime:
+    """Return the next midnight Pacific time, when the daily quota resets, as aware UTC"""
+    now = (now or datetime.now(timezone.utc)).astimezone(PACIFIC)
+    midnight = datetime(now.year, now.month, now.day, tzinfo=PACIFIC) + timedelta(days=1)
+    return midnight.astimezone(timezone.utc)
+
+
+# Partial responses: only the fields the trackers actually read
+CHANNEL_METADATA_FIELDS = "etag,items(id,snippet(title,thumbnails/default/url),contentDetails/relatedPlaylists/uploads)"
+CHANNEL_STATS_FIELDS = "etag,items(id,snippet(title,thumbnails/default/url),statistics)"
+PLAYLIST_UPLOADS_FIELDS = (
+    "etag,items(snippet(title,publishedAt,thumbnails(high/url,default/url),resourceId/videoId),"
+    "contentDetails(videoId,videoPublishedAt))"
+)
+LIVE_SEARCH_FIELDS = "etag,items/id/videoId"
+LIVE_DETAILS_FIELDS = "etag,items(id,snippet(title,thumbnails(maxres/url,high/url,default/url)),liveStreamingDetails)"
+CHANNEL_METADATA_TTL = 6 * 3600
+
+# youtube.com/<prefix>/<value> forms accepted for channel URLs, plus bare @handles and UC... IDs
+CHANNEL_URL_RE = re.compile(
+    r'(?:https?://)?(?:www\.|m\.)?youtube\.com/(?P<prefix>@|channel/|c/|user/)(?P<value>[^/?#&]+)',
+    re.IGNORECASE
+)
+CHANNEL_ID_RE = re.compile(r'^UC[\w-]{22}$')
+RESOLVED_TTL = 30 * 86400    # Handles can be renamed, so positive results expire eventually
+UNRESOLVED_TTL = 6 * 3600    # Misses are retried after this long
+
+
+def chunked(items: list, size: int = MAX_IDS_PER_REQUEST) -> list:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def uploads_playlist_id(channel_id: str, channel_info: dict = None) -> str:
+    """Return the channel's uploads playlist, derived from the channel ID if not in the lookup"""
+    if channel_info:
+        playlist_id = channel_info.get('contentDetails', {}).get('relatedPlaylists', {}).get('uploads')
+        if playlist_id:
+            return playlist_id
+    return 'UU' + channel_id[2:]
+
+
+def parse_playlist_uploads(response: dict) -> list:
+    """Normalize playlistItems.list items into upload dicts, newest first"""
+    uploads = []
+    for item in response.get('items', []):
+        snippet = item.get('snippet', {})
+        details = item.get('contentDetails', {})
+        video_id = details.get('videoId') or snippet.get('resourceId', {}).get('videoId')
+        if not video_id:
+            continue
+        thumbnails = snippet.get('thumbnails', {})
+        thumbnail = (thumbnails.get('high') or thumbnails.get('default') or {}).get('url')
+        uploads.append({
+            'video_id': video_id,
+            'title': snippet.get('title', ''),
+            'published': details.get('videoPublishedAt') or snippet.get('publishedAt'),
+            'thumbnail': thumbnail
+        })
+    return uploads
+
+
+class QuotaExceeded(Exception):
+    """Raised instead of calling the API while the quota circuit breaker is open"""
+
+    def __init__(self, reopen_at: datetime):
+        super().__init__(f"YouTube API quota exhausted until {reopen_at:%Y-%m-%d %H:%M} UTC")
+        self.reopen_at = reopen_at
+
+
+def is_quota_error(error: HttpError) -> bool:
+    if error.resp.status != 403:
+        return False
+    try:
+        reasons = [detail.get('reason') for detail in json.loads(error.content)['error']['errors']]
+    except (ValueError, KeyError, TypeError):
+        return False
+    return any(reason in ('quotaExceeded', 'dailyLimitExceeded') for reason in reasons)
+
+
+class QuotaCircuitBreaker:
+    """Stops all API traffic once the daily quota is exhausted.
+
+    Opens on a quotaExceeded error and stays open until the next quota reset.
+    After that a single cheap probe call decides whether to close again or
+    wait for another hour.
+    """
+
+    def __init__(self):
+        self.state = 'closed'
+        self.reopen_at = None
+        self.opened_at = None
+
+    def trip(self, reopen_at: datetime):
+        if self.state != 'open':
+            self.opened_at = datetime.now(timezone.utc)
+        self.state = 'open'
+        self.reopen_at = reopen_at
+
+    def close(self):
+        self.state = 'closed'
+        self.reopen_at = None
+        self.opened_at = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are blocked right now (an open breaker past its reset time may probe)"""
+        return self.state == 'open' and datetime.now(timezone.utc) < self.reopen_at
+
+    @property
+    def probe_due(self) -> bool:
+        return self.state == 'open' and datetime.now(timezone.utc) >= self.reopen_at
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self._data.pop(key, None)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, age: float = 0):
+        with self._lock:
+            self._data[key] = (time.monotonic() - age, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def entries(self) -> list:
+        """Unexpired (key, value, age_seconds) tuples, for persisting the cache"""
+        now = time.monotonic()
+        with self._lock:
+            return [(key, value, now - stored) for key, (stored, value) in self._data.items() if now - stored <= self.ttl]
+
+    def __len__(self):
+        return len(self._data)
+
+
+class QuotaBudget:
+    """Accounts every API call against the daily quota"""
+
+    def __init__(self, daily_limit: int = DEFAULT_DAILY_QUOTA):
+        self.daily_limit = daily_limit
+        self.used = 0
+        self.window_start = time.time()
+        self.reset_at = next_quota_reset()
+
+    def _roll(self):
+        if datetime.now(timezone.utc) >= self.reset_at:
+            self.used = 0
+            self.window_start = self.reset_at.timestamp()
+            self.reset_at = next_quota_reset()
+
+    def charge(self, resource: str, method: str):
+        self._roll()
+        self.used += call_cost(resource, method)
+
+    @property
+    def remaining(self) -> int:
+        self._roll()
+        return max(self.daily_limit - self.used, 0)
+
+    def projected_exhaustion(self) -> Optional[datetime]:
+        """When the budget runs out at today's burn rate, or None if it lasts until reset"""
+        remaining = self.remaining
+        elapsed = time.time() - self.window_start
+        if not self.used or elapsed <= 0:
+            return None
+        exhaustion = datetime.now(timezone.utc) + timedelta(seconds=remaining * elapsed / self.used)
+        return exhaustion if exhaustion < self.reset_at else None
+
+    def cycle_allowance(self, cycle_seconds: float) -> float:
+        """Units one poll cycle may spend to spread the remaining budget evenly until reset"""
+        seconds_left = (self.reset_at - datetime.now(timezone.utc)).total_seconds()
+        return self.remaining / max(seconds_left / cycle_seconds, 1)
+
+
+class QuotaPlanner:
+    """Plans which channels a poll cycle can afford.
+
+    Each cycle earns its share of the remaining daily budget as credit. Channels
+    are granted round-robin across guilds (starting with a different guild every
+    cycle) at the cheap "light" level, then upgraded to a "full" poll in priority
+    order while credit lasts, so a tight budget degrades low-priority trackers first.
+    """
+
+    def __init__(self, budget: QuotaBudget, cycle_seconds: float):
+        self.budget = budget
+        self.cycle_seconds = cycle_seconds
+        self.credit = 0.0
+        self.rotation = 0
+
+    def plan(self, guild_channels: dict, priorities: dict, light_cost, full_cost) -> dict:
+        """Map affordable channel IDs to "light" or "full"
+
+        guild_channels maps guild -> channel IDs in that guild's preferred order,
+        light_cost/full_cost are callables returning a channel's estimated units.
+        """
+        max_credit = self.budget.daily_limit / 24
+        self.credit = min(self.credit + self.budget.cycle_allowance(self.cycle_seconds), max_credit)
+
+        guilds = list(guild_channels)
+        if guilds:
+            offset = self.rotation % len(guilds)
+            guilds = guilds[offset:] + guilds[:offset]
+            self.rotation += 1
+
+        # Round-robin across guilds so one guild's trackers can't starve the rest
+        order = []
+        seen = set()
+        queues = [deque(guild_channels[guild]) for guild in guilds]
+        while queues:
+            for queue in queues:
+                while queue:
+                    channel_id = queue.popleft()
+                    if channel_id not in seen:
+                        seen.add(channel_id)
+                        order.append(channel_id)
+                        break
+            queues = [queue for queue in queues if queue]
+
+        plan = {}
+        for channel_id in order:
+            cost = light_cost(channel_id)
+            if cost <= self.credit:
+                plan[channel_id] = 'light'
+                self.credit -= cost
+
+        for channel_id in sorted(plan, key=lambda c: -priorities.get(c, 0)):
+            extra = full_cost(channel_id) - light_cost(channel_id)
+            if extra <= self.credit:
+                plan[channel_id] = 'full'
+                self.credit -= extra
+        return plan
+
+
+class YouTubeClient:
+    """Async wrapper around the YouTube Data API.
+
+    googleapiclient is blocking and its httplib2 connections are not thread-safe,
+    so every worker thread builds its own service object and requests run on a
+    bounded executor instead of the event loop.
+    """
+
+    def __init__(self, api_key: str, max_workers: int = 8, daily_quota: int = DEFAULT_DAILY_QUOTA):
+        self.api_key = api_key
+        self.quota = QuotaBudget(daily_quota)
+        self.breaker = QuotaCircuitBreaker()
+        self._probe_lock = asyncio.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="youtube")
+        self._local = threading.local()
+        self.calls = 0
+        # Last response + ETag per distinct request, replayed as If-None-Match
+        self._etags = TTLCache(maxsize=5000, ttl=24 * 3600)
+        self.channel_metadata = TTLCache(maxsize=5000, ttl=CHANNEL_METADATA_TTL)
+        self.etag_requests = 0
+        self.etag_hits = 0
+        self.bytes_saved = 0
+
+    def _service(self):
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = build('youtube', 'v3', developerKey=self.api_key, cache_discovery=False)
+            self._local.service = service
+        return service
+
+    def _execute(self, resource: str, method: str, params: dict) -> dict:
+        request = getattr(getattr(self._service(), resource)(), method)(**params)
+        key = (resource, method, tuple(sorted(params.items())))
+        cached = self._etags.get(key)
+        if cached:
+            request.headers['If-None-Match'] = cached[0]
+            self.etag_requests += 1
+        try:
+            response = request.execute()
+        except HttpError as e:
+            if cached and e.resp.status == 304:
+                self.etag_hits += 1
+                self.bytes_saved += cached[2]
+                return cached[1]
+            raise
+        if response.get('etag'):
+            self._etags.set(key, (response['etag'], response, len(json.dumps(response))))
+        return response
+
+    def _trip(self):
+        self.quota.used = max(self.quota.used, self.quota.daily_limit)
+        self.breaker.trip(next_quota_reset())
+
+    async def _probe(self):
+        """One 1-unit call to check whether quota is available again"""
+        async with self._probe_lock:
+            if not self.breaker.probe_due:
+                return
+            self.calls += 1
+            self.quota.charge('i18nRegions', 'list')
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(
+                    self.executor, self._execute, 'i18nRegions', 'list', {'part': 'id', 'hl': 'en_US'}
+                )
+            except HttpError as e:
+                if not is_quota_error(e):
+                    raise
+                self.breaker.trip(datetime.now(timezone.utc) + timedelta(hours=1))
+                return
+            self.breaker.close()
+
+    async def call(self, resource: str, method: str, **params) -> dict:
+        """Run e.g. ``call('channels', 'list', part='snippet', id=...)`` off the event loop"""
+        if self.breaker.probe_due:
+            await self._probe()
+        if self.breaker.state == 'open':
+            raise QuotaExceeded(self.breaker.reopen_at)
+
+        self.calls += 1
+        self.quota.charge(resource, method)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, self._execute, resource, method, params)
+        except HttpError as e:
+            if is_quota_error(e):
+                self._trip()
+                raise QuotaExceeded(self.breaker.reopen_at) from e
+            raise
+
+    async def _fetch_by_ids(self, resource: str, ids, part: str, fields: str = None) -> dict:
+        ids = list(dict.fromkeys(item_id for item_id in ids if item_id))
+        extra = {'fields': fields} if fields else {}
+        responses = await asyncio.gather(*(
+            self.call(resource, 'list', part=part, id=','.join(batch), **extra)
+            for batch in chunked(ids)
+        ))
+        return {item['id']: item for response in responses for item in response.get('items', [])}
+
+    async def fetch_channels(self, channel_ids, part: str = 'statistics,snippet', fields: str = None) -> dict:
+        """Look up channels in batches of 50 IDs and return the items keyed by channel ID"""
+        return await self._fetch_by_ids('channels', channel_ids, part, fields)
+
+    async def fetch_videos(self, video_ids, part: str = 'snippet,liveStreamingDetails', fields: str = None) -> dict:
+        """Look up videos in batches of 50 IDs and return the items keyed by video ID"""
+        return await self._fetch_by_ids('videos', video_ids, part, fields)
+
+    async def fetch_channel_metadata(self, channel_ids) -> dict:
+        """Channel titles, thumbnails and uploads playlists, served from the TTL cache while fresh"""
+        metadata = {}
+        missing = []
+        for channel_id in dict.fromkeys(channel_ids):
+            cached = self.channel_metadata.get(channel_id)
+            if cached:
+                metadata[channel_id] = cached[0]
+                self.bytes_saved += cached[1]
+            else:
+                missing.append(channel_id)
+
+        if missing:
+            fetched = await self.fetch_channels(missing, part='snippet,contentDetails', fields=CHANNEL_METADATA_FIELDS)
+            for channel_id, item in fetched.items():
+                self.channel_metadata.set(channel_id, (item, len(json.dumps(item))))
+                metadata[channel_id] = item
+        return metadata
+
+    def cache_stats(self) -> dict:
+        lookups = self.channel_metadata.hits + self.channel_metadata.misses
+        return {
+            'metadata_hit_rate': self.channel_metadata.hits / lookups if lookups else 0.0,
+            'etag_hit_rate': self.etag_hits / self.etag_requests if self.etag_requests else 0.0,
+            'bytes_saved': self.bytes_saved
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+
+def parse_channel_url(url: str) -> Optional[tuple]:
+    """Split a channel URL into ``(kind, value)`` with kind one of id, handle, custom or username"""
+    url = (url or '').strip()
+    if CHANNEL_ID_RE.match(url):
+        return 'id', url
+    if url.startswith('@'):
+        return 'handle', url[1:]
+    match = CHANNEL_URL_RE.search(url)
+    if not match:
+        return None
+    kind = {'@': 'handle', 'channel/': 'id', 'c/': 'custom', 'user/': 'username'}[match['prefix'].lower()]
+    return kind, match['value']
+
+
+class ChannelResolver:
+    """Resolves channel URLs and handles to channel IDs, caching hits and misses on disk.
+
+    Handles and legacy usernames cost one ``channels.list`` unit each. ``/c/``
+    custom URLs have no direct lookup, so they are tried as a handle and then as
+    a username before giving up.
+    """
+
+    def __init__(self, client: YouTubeClient, path: str = None):
+        self.client = client
+        self.path = path
+        self._cache = {}  # 'kind:value' -> {'channel_id': str or None, 'resolved_at': timestamp}
+        self.lookups = 0
+        self.hits = 0
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self._cache = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading channel resolutions: {e}")
+            self._cache = {}
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self._cache, f)
+        except Exception as e:
+            print(f"⚠️ Error saving channel resolutions: {e}")
+
+    def _cached(self, key: str):
+        entry = self._cache.get(key)
+        if not entry:
+            return False, None
+        ttl = RESOLVED_TTL if entry['channel_id'] else UNRESOLVED_TTL
+        if time.time() - entry['resolved_at'] > ttl:
+            return False, None
+        return True, entry['channel_id']
+
+    async def _lookup(self, kind: str, value: str) -> Optional[str]:
+        if kind == 'handle':
+            attempts = [('forHandle', value)]
+        elif kind == 'username':
+            attempts = [('forUsername', value)]
+        else:
+            attempts = [('forHandle', value), ('forUsername', value)]
+        for param, lookup_value in attempts:
+            response = await self.client.call('channels', 'list', part='id', fields='items/id', **{param: lookup_value})
+            if response.get('items'):
+                return response['items'][0]['id']
+        return None
+
+    async def resolve(self, url: str, persist: bool = True) -> Optional[str]:
+        """Return the channel ID for a URL or handle, or None if it doesn't resolve.
+
+        Raises ValueError when the input isn't a recognizable channel URL.
+        """
+        parsed = parse_channel_url(url)
+        if not parsed:
+            raise ValueError("Not a YouTube channel URL")
+        kind, value = parsed
+        if kind == 'id':
+            return value
+
+        key = f"{kind}:{value.lower()}"
+        self.lookups += 1
+        found, channel_id = self._cached(key)
+        if found:
+            self.hits += 1
+            return channel_id
+
+        channel_id = await self._lookup(kind, value)
+        self._cache[key] = {'channel_id': channel_id, 'resolved_at': time.time()}
+        if persist:
+            self.save()
+        return channel_id
+
+    async def resolve_many(self, urls) -> dict:
+        """Resolve many URLs, 50 lookups at a time, with one cache write at the end.
+
+        Returns ``{url: channel_id or None}``; unrecognizable URLs map to None.
+        """
+        results = {}
+        try:
+            for batch in chunked(list(dict.fromkeys(urls))):
+                resolved = await asyncio.gather(
+                    *(self.resolve(url, persist=False) for url in batch), return_exceptions=True
+                )
+                for url, channel_id in zip(batch, resolved):
+                    if isinstance(channel_id, QuotaExceeded):
+                        raise channel_id
+                    results[url] = None if isinstance(channel_id, Exception) else channel_id
+        finally:
+            self.save()
+        return results
@@ -0,0 +1,206 @@
+import asyncio
+import hmac
+import secrets
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlparse, parse_qs
+import requests
+from requests.adapters import HTTPAdapter
+
+FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+HUB_URL = "https://pubsubhubbub.appspot.com/subscribe"
+TOPIC_URL = "https://www.youtube.com/xml/feeds/videos.xml?channel_id={}"
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+YT_NS = '{http://www.youtube.com/xml/schemas/2015}'
+MEDIA_NS = '{http://search.yahoo.com/mrss/}'
+
+
+def normalize_timestamp(value: str) -> str:
+    """Convert an Atom timestamp with offset to the API's ``...Z`` UTC form"""
+    if not value:
+        return value
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def parse_feed(chunks) -> list:
+    """Stream-parse a YouTube Atom feed into upload dicts, newest first"""
+    parser = ET.XMLPullParser(events=('end',))
+    uploads = []
+
+    def drain():
+        for _, elem in parser.read_events():
+            if elem.tag != ATOM_NS + 'entry':
+                continue
+            thumbnail = elem.find(f'{MEDIA_NS}group/{MEDIA_NS}thumbnail')
+            uploads.append({
+                'video_id': elem.findtext(YT_NS + 'videoId'),
+                'channel_id': elem.findtext(YT_NS + 'channelId'),
+                'title': elem.findtext(ATOM_NS + 'title', ''),
+                'published': normalize_timestamp(elem.findtext(ATOM_NS + 'published')),
+                'thumbnail': thumbnail.get('url') if thumbnail is not None else None
+            })
+            elem.clear()
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        drain()
+    parser.close()
+    drain()
+    return [upload for upload in uploads if upload['video_id']]
+
+
+class YouTubeFeedPoller:
+    """Zero-quota upload detection from the public per-channel Atom feeds.
+
+    Each worker thread keeps its own keep-alive session, and ETag /
+    Last-Modified validators are replayed so an unchanged feed costs a 304.
+    """
+
+    def __init__(self, max_workers: int = 8, timeout: int = 10, feed_url: str = FEED_URL):
+        self.timeout = timeout
+        self.feed_url = feed_url
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="yt-feed")
+        self._local = threading.local()
+        self._cache = {}  # channel_id -> {'etag', 'last_modified', 'uploads'}
+        self.stats = {'requests': 0, 'not_modified': 0, 'bytes': 0}
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            self._local.session = session
+        return session
+
+    def _fetch(self, channel_id: str) -> list:
+        cached = self._cache.get(channel_id, {})
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        self.stats['requests'] += 1
+        url = self.feed_url.format(channel_id)
+        with self._session().get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 304:
+                self.stats['not_modified'] += 1
+                return cached.get('uploads', [])
+            response.raise_for_status()
+
+            def chunks():
+                for chunk in response.iter_content(chunk_size=8192):
+                    self.stats['bytes'] += len(chunk)
+                    yield chunk
+
+            uploads = parse_feed(chunks())
+            self._cache[channel_id] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'uploads': uploads
+            }
+            return uploads
+
+    async def fetch_uploads(self, channel_id: str) -> list:
+        """Return the channel's feed entries, newest first, without using API quota"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._fetch, channel_id)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
+
+
+def topic_channel_id(topic: str):
+    """Extract the channel ID from a WebSub topic URL"""
+    return parse_qs(urlparse(topic or '').query).get('channel_id', [None])[0]
+
+
+def verify_signature(secret: str, body: bytes, header: str) -> bool:
+    """Check an ``X-Hub-Signature: sha1=<hex>`` header against the shared secret"""
+    if not secret or not header or '=' not in header:
+        return False
+    algorithm, digest = header.split('=', 1)
+    if algorithm not in ('sha1', 'sha256', 'sha384', 'sha512'):
+        return False
+    expected = hmac.new(secret.encode(), body, algorithm).hexdigest()
+    return hmac.compare_digest(expected, digest)
+
+
+class WebSubSubscriber:
+    """Keeps WebSub (PubSubHubbub) leases alive for tracked YouTube channels"""
+
+    def __init__(self, callback_url: str, secret: str = None, lease_seconds: int = 432000,
+                 renew_margin: int = 86400, hub_url: str = HUB_URL):
+        self.callback_url = callback_url
+        # Pushes are only trusted when signed, so a secret is always sent to the hub. A generated
+        # one changes on restart, when every lease is renewed (and re-keyed) anyway.
+        self.secret = secret or secrets.token_hex(32)
+        self.lease_seconds = lease_seconds
+        self.renew_margin = renew_margin
+        self.hub_url = hub_url
+        self.leases = {}   # channel_id -> lease expiry timestamp, set when the hub verifies
+        self.pending = {}  # channel_id -> time the last subscribe request was sent
+        self.session = requests.Session()
+
+    def _request(self, channel_id: str, mode: str):
+        data = {
+            'hub.callback': self.callback_url,
+            'hub.topic': TOPIC_URL.format(channel_id),
+            'hub.mode': mode,
+            'hub.verify': 'async',
+            'hub.lease_seconds': str(self.lease_seconds),
+            'hub.secret': self.secret
+        }
+        response = self.session.post(self.hub_url, data=data, timeout=10)
+        response.raise_for_status()
+
+    def needs_renewal(self, channel_id: str) -> bool:
+        now = time.time()
+        if now - self.pending.get(channel_id, 0) < 600:
+            return False  # Still waiting for the hub to verify
+        return self.leases.get(channel_id, 0) - now < self.renew_margin
+
+    async def renew(self, channel_ids) -> int:
+        """Subscribe every channel without a lease or close to expiry, return how many were sent"""
+        loop = asyncio.get_running_loop()
+        sent = 0
+        for channel_id in channel_ids:
+            if not self.needs_renewal(channel_id):
+                continue
+            try:
+                await loop.run_in_executor(None, self._request, channel_id, 'subscribe')
+                self.pending[channel_id] = time.time()
+                sent += 1
+            except Exception as e:
+                print(f"[WebSub] Subscribe failed for {channel_id}: {e}")
+        return sent
+
+    def confirm(self, mode: str, topic: str, lease_seconds, tracked_channels) -> bool:
+        """Handle the hub's verification request, returning whether to echo the challenge"""
+        channel_id = topic_channel_id(topic)
+        if not channel_id:
+            return False
+        if mode == 'subscribe':
+            if channel_id not in tracked_channels:
+                return False
+            try:
+                lease_seconds = int(lease_seconds or self.lease_seconds)
+            except ValueError:
+                return False
+            if lease_seconds <= 0:
+                return False
+            self.pending.pop(channel_id, None)
+            self.leases[channel_id] = time.time() + lease_seconds
+            return True
+        if mode == 'unsubscribe':
+            self.leases.pop(channel_id, None)
+            return True
+        return False
+
+    def is_active(self, channel_id: str) -> bool:
+        return self.leases.get(channel_id, 0) > time.time()
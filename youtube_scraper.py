@@ -0,0 +1,271 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from youtube_api import TTLCache, parse_channel_url
+from youtube_feeds import FEED_URL, parse_feed, normalize_timestamp
+
+CHANNEL_URL = "https://www.youtube.com/channel/{}"
+CHANNEL_LIVE_URL = "https://www.youtube.com/channel/{}/live"
+HANDLE_URL = "https://www.youtube.com/@{}"
+WATCH_URL = "https://www.youtube.com/watch?v={}"
+
+# Skip the EU consent interstitial and get English count labels
+SCRAPE_HEADERS = {
+    'User-Agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    'Accept-Language': "en-US,en;q=0.9"
+}
+SCRAPE_COOKIES = {'SOCS': 'CAI', 'CONSENT': 'YES+1'}
+
+SUBSCRIBERS_RE = re.compile(r'"(?:simpleText|content|label)":"([\d.,]+)\s*([KMB]?) subscribers"')
+VIDEOS_RE = re.compile(r'"(?:simpleText|content)":"([\d.,]+)\s*([KMB]?) videos"')
+WATCHING_RE = re.compile(r'"([\d,]+)"\},\{"text":" watching(?: now)?"')
+COUNT_SUFFIXES = {'': 1, 'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+
+def parse_count(number: str, suffix: str = '') -> int:
+    """Turn an abbreviated count label like ``1.23M`` into an (approximate) integer"""
+    return int(float(number.replace(',', '')) * COUNT_SUFFIXES[suffix.upper()])
+
+
+def extract_json(html: str, name: str):
+    """Decode the ``var name = {...};`` object YouTube embeds in its pages"""
+    match = re.search(rf'{name}\s*=\s*{{', html)
+    if not match:
+        return None
+    try:
+        return json.JSONDecoder().raw_decode(html, match.end() - 1)[0]
+    except ValueError:
+        return None
+
+
+class ScrapeResults(dict):
+    """Items keyed by ID, plus the IDs whose pages couldn't be fetched or read.
+
+    An ID in neither doesn't exist. Failed IDs say nothing about their item and
+    callers should retry them rather than treat them as deleted.
+    """
+
+    def __init__(self, items: dict = None, failed: set = None):
+        super().__init__(items or {})
+        self.failed = failed or set()
+
+
+class HostRateLimiter:
+    """Spaces out requests to each host to at most ``rate`` per second, across all threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next = {}  # host -> earliest time the next request may start
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next.get(host, 0))
+            self._next[host] = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class YouTubeScraper:
+    """Key-less fallback that reads public channel, live and watch pages.
+
+    Results mirror the Data API item shapes the trackers already consume, so it
+    can stand in for YouTubeClient when no API key is configured or the quota
+    is exhausted. Counts come from rounded page labels and are approximate.
+    """
+
+    def __init__(self, max_workers: int = 4, rate: float = 2.0, timeout: int = 10,
+                 channel_ttl: float = 3600, live_ttl: float = 60):
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="yt-scrape")
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=max_workers))
+        self.session.headers.update(SCRAPE_HEADERS)
+        self.session.cookies.update(SCRAPE_COOKIES)
+        self.limiter = HostRateLimiter(rate)
+        self._channels = TTLCache(maxsize=5000, ttl=channel_ttl)
+        self._live = TTLCache(maxsize=5000, ttl=live_ttl)
+        self.stats = {'requests': 0, 'errors': 0}
+
+    def _get(self, url: str) -> requests.Response:
+        """Rate-limited GET, a 404 is returned for the caller to handle instead of raised"""
+        self.limiter.wait(url)
+        self.stats['requests'] += 1
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code != 404:
+                response.raise_for_status()
+        except requests.RequestException:
+            self.stats['errors'] += 1
+            raise
+        return response
+
+    def _scrape_channel(self, channel_id: str) -> dict:
+        cached = self._channels.get(channel_id)
+        if cached is not None:
+            return cached
+        response = self._get(CHANNEL_URL.format(channel_id))
+        if response.status_code == 404:
+            return None
+        html = response.text
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('meta'))
+        title = soup.find('meta', property='og:title')
+        image = soup.find('meta', property='og:image')
+        if not title:
+            # Consent walls, bot checks and layout changes, not a missing channel
+            raise ValueError("Unrecognized channel page")
+
+        # Rounded labels, kept out of anything that needs exact counts
+        statistics = {'approximate': True}
+        subscribers = SUBSCRIBERS_RE.search(html)
+        if subscribers:
+            statistics['subscriberCount'] = str(parse_count(*subscribers.groups()))
+        else:
+            statistics['hiddenSubscriberCount'] = True
+        videos = VIDEOS_RE.search(html)
+        if videos:
+            statistics['videoCount'] = str(parse_count(*videos.groups()))
+
+        item = {
+            'id': channel_id,
+            'snippet': {
+                'title': title['content'],
+                'thumbnails': {'default': {'url': image['content'] if image else None}}
+            },
+            'statistics': statistics,
+            'contentDetails': {'relatedPlaylists': {'uploads': 'UU' + channel_id[2:]}}
+        }
+        self._channels.set(channel_id, item)
+        return item
+
+    def _scrape_video(self, video_id: str) -> dict:
+        response = self._get(WATCH_URL.format(video_id))
+        if response.status_code == 404:
+            return None
+        html = response.text
+        player = extract_json(html, 'ytInitialPlayerResponse')
+        if not player:
+            raise ValueError("Unrecognized watch page")
+        if 'videoDetails' not in player:
+            return None  # Deleted or private
+        details = player['videoDetails']
+        broadcast = player.get('microformat', {}).get('playerMicroformatRenderer', {}).get('liveBroadcastDetails')
+        thumbnails = details.get('thumbnail', {}).get('thumbnails', [])
+
+        item = {
+            'id': video_id,
+            'snippet': {
+                'title': details.get('title', ''),
+                'thumbnails': {'high': {'url': thumbnails[-1]['url']}} if thumbnails else {}
+            }
+        }
+        if broadcast:
+            live = {}
+            if broadcast.get('startTimestamp'):
+                live['actualStartTime'] = normalize_timestamp(broadcast['startTimestamp'])
+            if broadcast.get('endTimestamp'):
+                live['actualEndTime'] = normalize_timestamp(broadcast['endTimestamp'])
+            elif broadcast.get('isLiveNow'):
+                watching = WATCHING_RE.search(html)
+                live['concurrentViewers'] = watching.group(1).replace(',', '') if watching else '0'
+            item['liveStreamingDetails'] = live
+        return item
+
+    def _find_live_video(self, channel_id: str):
+        cached = self._live.get(channel_id)
+        if cached is not None:
+            return cached or None
+        response = self._get(CHANNEL_LIVE_URL.format(channel_id))
+        html = response.text if response.status_code != 404 else ''
+        # A live channel's /live page is the stream's watch page
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('link'))
+        canonical = soup.find('link', rel='canonical')
+        video_id = None
+        if canonical and 'watch?v=' in canonical.get('href', '') and '"isLiveNow":true' in html:
+            video_id = canonical['href'].split('watch?v=')[1].split('&')[0]
+        self._live.set(channel_id, video_id or '')
+        return video_id
+
+    def _resolve(self, url: str):
+        parsed = parse_channel_url(url)
+        if not parsed:
+            raise ValueError("Not a YouTube channel URL")
+        kind, value = parsed
+        if kind == 'id':
+            return value
+        page = {
+            'handle': HANDLE_URL.format(value),
+            'custom': f"https://www.youtube.com/c/{value}",
+            'username': f"https://www.youtube.com/user/{value}"
+        }[kind]
+        response = self._get(page)
+        if response.status_code == 404:
+            return None
+        soup = BeautifulSoup(response.text, 'html.parser', parse_only=SoupStrainer(['meta', 'link']))
+        identifier = soup.find('meta', itemprop='identifier') or soup.find('meta', itemprop='channelId')
+        if identifier:
+            return identifier['content']
+        canonical = soup.find('link', rel='canonical')
+        if canonical and '/channel/' in canonical.get('href', ''):
+            return canonical['href'].split('/channel/')[1].split('/')[0]
+        return None
+
+    def _fetch_uploads(self, channel_id: str) -> list:
+        response = self._get(FEED_URL.format(channel_id))
+        if response.status_code == 404:
+            return []
+        return parse_feed([response.content])
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _gather(self, func, ids) -> ScrapeResults:
+        ids = list(dict.fromkeys(item_id for item_id in ids if item_id))
+        results = await asyncio.gather(*(self._run(func, item_id) for item_id in ids), return_exceptions=True)
+        items = ScrapeResults()
+        for item_id, item in zip(ids, results):
+            if isinstance(item, Exception):
+                print(f"[YouTube Scraper] Error fetching {item_id}: {item}")
+                items.failed.add(item_id)
+            elif item:
+                items[item_id] = item
+        return items
+
+    async def fetch_channels(self, channel_ids, part: str = None, fields: str = None) -> ScrapeResults:
+        """Channel items keyed by ID, like YouTubeClient.fetch_channels (part/fields are ignored)"""
+        return await self._gather(self._scrape_channel, channel_ids)
+
+    async def fetch_channel_metadata(self, channel_ids) -> ScrapeResults:
+        return await self.fetch_channels(channel_ids)
+
+    async def fetch_videos(self, video_ids, part: str = None, fields: str = None) -> ScrapeResults:
+        """Video items with liveStreamingDetails keyed by ID, like YouTubeClient.fetch_videos"""
+        return await self._gather(self._scrape_video, video_ids)
+
+    async def find_live_video(self, channel_id: str):
+        """The ID of the channel's current live stream, or None"""
+        return await self._run(self._find_live_video, channel_id)
+
+    async def fetch_uploads(self, channel_id: str) -> list:
+        """Recent uploads from the channel's Atom feed, newest first"""
+        return await self._run(self._fetch_uploads, channel_id)
+
+    async def resolve(self, url: str):
+        """Channel ID for a channel URL or handle from its public page, None if it doesn't exist.
+
+        Raises ValueError when the input isn't a recognizable channel URL.
+        """
+        return await self._run(self._resolve, url)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)